@@ -14,6 +14,12 @@ from typing import List, Dict, Optional, Tuple
 logger = logging.getLogger(__name__)
 
 
+def _invalidate_statistics():
+    """对话数据变化后使统计缓存失效"""
+    from core.statistics import StatisticsManager
+    StatisticsManager().invalidate()
+
+
 class Message:
     """消息类"""
     
@@ -212,6 +218,7 @@ class ConversationManager:
         self.conversations[conv.id] = conv
         self.current_conversation = conv
         self._save_conversation(conv)
+        _invalidate_statistics()
         return conv
     
     def get_conversation(self, conv_id: str) -> Optional[Conversation]:
@@ -230,6 +237,7 @@ class ConversationManager:
             self._cleanup_session_status(conv_id)
             if self.current_conversation and self.current_conversation.id == conv_id:
                 self.current_conversation = None
+            _invalidate_statistics()
             return True
         return False
     
@@ -295,5 +303,6 @@ class ConversationManager:
                 self.current_conversation = latest
             message = self.current_conversation.add_message(role, content, confidence, rag_trace=rag_trace)
             self._save_conversation(self.current_conversation)
+            _invalidate_statistics()
             return message
         return None
@@ -17,6 +17,8 @@ from typing import Dict, List, Optional, Callable
 from threading import Lock
 from contextlib import contextmanager
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,10 +41,19 @@ class MetricCollector:
         self._records: deque = deque(maxlen=max_records)
         self._lock = Lock()
         
+        # 耗时与成功标记的环形缓冲区（与 _records 同步），统计时直接向量化计算
+        self._durations = np.empty(max_records, dtype=np.float64)
+        self._successes = np.zeros(max_records, dtype=bool)
+        self._head = 0  # 下一条写入位置
+        self._size = 0
+        
         # 累计统计
         self._total_count = 0
         self._success_count = 0
         self._total_duration = 0.0
+        
+        # 数据版本号（每次记录或清空时递增）
+        self._version = 0
     
     def record(self, duration: float, success: bool = True, metadata: dict = None):
         """记录一次指标"""
@@ -55,10 +66,17 @@ class MetricCollector:
         
         with self._lock:
             self._records.append(record)
+            head = self._head
+            self._durations[head] = duration
+            self._successes[head] = success
+            self._head = (head + 1) % self._max_records
+            if self._size < self._max_records:
+                self._size += 1
             self._total_count += 1
             if success:
                 self._success_count += 1
             self._total_duration += duration
+            self._version += 1
     
     @contextmanager
     def measure(self, metadata: dict = None):
@@ -81,12 +99,12 @@ class MetricCollector:
             last_n: 只统计最近N条记录，None表示全部
         """
         with self._lock:
-            if last_n:
-                records = list(self._records)[-last_n:]
-            else:
-                records = list(self._records)
+            n = min(last_n, self._size) if last_n else self._size
+            durations, successes = self._recent(n)
+            total_count = self._total_count
+            total_success = self._success_count
         
-        if not records:
+        if n == 0:
             return {
                 "name": self.name,
                 "count": 0,
@@ -99,33 +117,53 @@ class MetricCollector:
                 "p99_duration": 0.0
             }
         
-        durations = [r.duration for r in records]
-        success_count = sum(1 for r in records if r.success)
-        
-        durations_sorted = sorted(durations)
-        n = len(durations_sorted)
+        # 分位数取值位置与排序后按下标取值一致，用部分排序（introselect）代替全排序
+        k50 = n // 2
+        k95 = int(n * 0.95) if n >= 20 else n - 1
+        k99 = int(n * 0.99) if n >= 100 else n - 1
+        part = np.partition(durations, sorted({0, k50, k95, k99, n - 1}))
         
         return {
             "name": self.name,
-            "count": len(records),
-            "success_rate": success_count / len(records),
-            "avg_duration": sum(durations) / len(durations),
-            "min_duration": min(durations),
-            "max_duration": max(durations),
-            "p50_duration": durations_sorted[n // 2],
-            "p95_duration": durations_sorted[int(n * 0.95)] if n >= 20 else durations_sorted[-1],
-            "p99_duration": durations_sorted[int(n * 0.99)] if n >= 100 else durations_sorted[-1],
-            "total_count": self._total_count,
-            "total_success": self._success_count
+            "count": n,
+            "success_rate": int(np.count_nonzero(successes)) / n,
+            "avg_duration": float(durations.mean()),
+            "min_duration": float(part[0]),
+            "max_duration": float(part[n - 1]),
+            "p50_duration": float(part[k50]),
+            "p95_duration": float(part[k95]),
+            "p99_duration": float(part[k99]),
+            "total_count": total_count,
+            "total_success": total_success
         }
     
+    def _recent(self, n: int):
+        """按时间顺序复制最近 n 条的耗时与成功标记（需持有锁）"""
+        start = (self._head - n) % self._max_records
+        end = start + n
+        if end <= self._max_records:
+            return self._durations[start:end].copy(), self._successes[start:end].copy()
+        end -= self._max_records
+        return (
+            np.concatenate((self._durations[start:], self._durations[:end])),
+            np.concatenate((self._successes[start:], self._successes[:end])),
+        )
+    
     def clear(self):
         """清空记录"""
         with self._lock:
             self._records.clear()
+            self._head = 0
+            self._size = 0
             self._total_count = 0
             self._success_count = 0
             self._total_duration = 0.0
+            self._version += 1
+    
+    @property
+    def version(self) -> int:
+        """数据版本号"""
+        return self._version
 
 
 class PerformanceMonitor:
@@ -155,12 +193,15 @@ class PerformanceMonitor:
         }
         
         self._start_time = time.time()
+        # 收集器增删或清空时递增，与各收集器版本号共同组成整体版本
+        self._version = 0
         logger.info("性能监控器初始化完成")
     
     def get_collector(self, name: str) -> MetricCollector:
         """获取或创建指标收集器"""
         if name not in self._collectors:
             self._collectors[name] = MetricCollector(name)
+            self._version += 1
         return self._collectors[name]
     
     @contextmanager
@@ -175,6 +216,21 @@ class PerformanceMonitor:
         collector = self.get_collector(metric_name)
         collector.record(duration, success, metadata)
     
+    def get_version(self) -> int:
+        """获取数据版本号
+        
+        任一指标有新记录或数据被清空时该值都会增大，可用于判断统计结果是否需要重新计算。
+        """
+        return self._version + sum(c.version for c in list(self._collectors.values()))
+    
+    def get_uptime(self) -> dict:
+        """获取运行时长"""
+        uptime = time.time() - self._start_time
+        return {
+            "uptime_seconds": uptime,
+            "uptime_formatted": self._format_duration(uptime),
+        }
+    
     def get_all_stats(self, last_n: int = None) -> Dict[str, dict]:
         """获取所有指标统计"""
         return {name: collector.get_stats(last_n) for name, collector in self._collectors.items()}
@@ -197,6 +253,58 @@ class PerformanceMonitor:
             "metrics": stats
         }
     
+    def get_dashboard_snapshot(self, last_n: int = None, include_summary: bool = True) -> dict:
+        """一次遍历获取仪表盘所需的全部数据
+        
+        合并 get_summary() 与 get_all_stats(last_n)，并同时计算加权平均耗时。
+        摘要部分与 get_summary() 一致，仍按最近100条统计。
+        
+        Args:
+            last_n: 只统计最近N条记录，None表示全部
+            include_summary: 为 False 时不计算摘要（调用方已有同一数据版本的摘要）
+        
+        Returns:
+            {"summary": 摘要或None, "stats": 各指标统计, "avg_duration": 加权平均耗时}
+        """
+        uptime = time.time() - self._start_time
+        
+        stats = {}
+        total_requests = 0
+        total_success = 0.0
+        total_duration = 0.0
+        total_count = 0
+        
+        for name, collector in list(self._collectors.items()):
+            s = collector.get_stats(last_n)
+            stats[name] = s
+            
+            if include_summary:
+                # 摘要固定统计最近100条，范围相同时直接复用
+                s100 = s if last_n == 100 else collector.get_stats(100)
+                count100 = s100["count"]
+                total_requests += count100
+                total_success += count100 * s100["success_rate"]
+            
+            count = s["count"]
+            if count > 0:
+                total_duration += s["avg_duration"] * count
+                total_count += count
+        
+        summary = None
+        if include_summary:
+            summary = {
+                "uptime_seconds": uptime,
+                "uptime_formatted": self._format_duration(uptime),
+                "total_requests": total_requests,
+                "overall_success_rate": total_success / total_requests if total_requests > 0 else 0.0,
+            }
+        
+        return {
+            "summary": summary,
+            "stats": stats,
+            "avg_duration": total_duration / total_count if total_count > 0 else 0,
+        }
+    
     def _format_duration(self, seconds: float) -> str:
         """格式化时长"""
         hours = int(seconds // 3600)
@@ -210,11 +318,14 @@ class PerformanceMonitor:
         else:
             return f"{secs}秒"
     
-    def export_report(self) -> str:
-        """导出性能报告"""
+    def iter_report_chunks(self):
+        """逐段生成性能报告文本，便于流式写入文件
+        
+        各段直接拼接即为完整报告（与 export_report() 结果一致）。
+        """
         summary = self.get_summary()
         
-        lines = [
+        yield "\n".join([
             "=" * 60,
             "性能监控报告",
             f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
@@ -227,11 +338,12 @@ class PerformanceMonitor:
             "-" * 60,
             "各指标详情:",
             "-" * 60,
-        ]
+        ])
         
         for name, stats in summary["metrics"].items():
             if stats["count"] > 0:
-                lines.extend([
+                yield "\n".join([
+                    "",
                     f"\n【{name}】",
                     f"  请求数: {stats['count']}",
                     f"  成功率: {stats['success_rate']:.1%}",
@@ -242,15 +354,18 @@ class PerformanceMonitor:
                     f"  P95耗时: {stats['p95_duration']*1000:.1f}ms",
                 ])
         
-        lines.append("\n" + "=" * 60)
-        
-        return "\n".join(lines)
+        yield "\n\n" + "=" * 60
+    
+    def export_report(self) -> str:
+        """导出性能报告"""
+        return "".join(self.iter_report_chunks())
     
     def clear_all(self):
         """清空所有记录"""
         for collector in self._collectors.values():
             collector.clear()
         self._start_time = time.time()
+        self._version += 1
         logger.info("性能监控数据已清空")
 
 
@@ -10,12 +10,14 @@
 
 
 from typing import List, Optional, Tuple, Dict, Callable
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 import json
 import os
 import logging
 import re
+import threading
 
 from core.config import Config
 
@@ -23,6 +25,12 @@ from core.config import Config
 logger = logging.getLogger(__name__)
 
 
+def _invalidate_statistics():
+    """知识库数据变化后使统计缓存失效"""
+    from core.statistics import StatisticsManager
+    StatisticsManager().invalidate()
+
+
 BASE_SYSTEM_PROMPT = "你是一个专业的电商客服助手，负责解答用户关于商品、订单、物流、退换货等问题。请用友好、专业的语气回复，回答要简洁有帮助。"
 
 
@@ -129,9 +137,36 @@ class KnowledgeItem:
     category: str = "通用"
     score: float = 1.0
     
+    # 列表展示时问题的最大长度
+    SHORT_QUESTION_CHARS = 35
+    
     def to_dict(self) -> dict:
         return asdict(self)
     
+    @property
+    def cached_keyword_str(self) -> str:
+        """关键词拼接文本（惰性计算并缓存，修改后需调用 invalidate_cache）"""
+        cached = self.__dict__.get("_keyword_str")
+        if cached is None:
+            cached = ", ".join(self.keywords)
+            self.__dict__["_keyword_str"] = cached
+        return cached
+    
+    @property
+    def cached_short_question(self) -> str:
+        """截断后的问题文本（惰性计算并缓存，修改后需调用 invalidate_cache）"""
+        cached = self.__dict__.get("_short_question")
+        if cached is None:
+            limit = self.SHORT_QUESTION_CHARS
+            cached = self.question[:limit] + "..." if len(self.question) > limit else self.question
+            self.__dict__["_short_question"] = cached
+        return cached
+    
+    def invalidate_cache(self):
+        """清除展示文本缓存"""
+        self.__dict__.pop("_keyword_str", None)
+        self.__dict__.pop("_short_question", None)
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'KnowledgeItem':
         return cls(
@@ -156,6 +191,22 @@ class ProductItem:
     stock: int = 0                                   # 库存数量
     keywords: List[str] = field(default_factory=list)  # 关键词
     
+    def __post_init__(self):
+        self.revision = 0
+        self.refresh_display()
+    
+    def refresh_display(self):
+        """重新生成列表显示用的文本（名称、价格、库存变化后调用）
+        
+        显示文本和修订号是普通属性而非数据类字段，不会写入 to_dict() 的结果。
+        每次调用都会递增修订号，界面据此判断已显示的内容是否过期。
+        """
+        self.revision += 1
+        name = self.name
+        self.display_name = name[:25] + "..." if len(name) > 25 else name
+        self.display_price = f"¥{self.price:.2f}"
+        self.display_stock = f"{self.stock}" if self.stock > 0 else "缺货"
+    
     def to_dict(self) -> dict:
         return asdict(self)
     
@@ -260,6 +311,9 @@ class KnowledgeStore:
     """知识库存储 - JSON文件持久化 + 向量检索 + 倒排索引"""
     _cache_mtime: float | None = None
     _cache_raw_items: list[dict] | None = None
+    # 所有实例共用的修改锁：商品同步会在线程池中修改知识库，
+    # 条目列表、倒排索引、数据文件和向量索引的修改需与界面线程串行执行
+    _lock = threading.RLock()
 
     def __init__(self):
         self.items: List[KnowledgeItem] = []
@@ -278,6 +332,10 @@ class KnowledgeStore:
         # 性能监控
         self._perf_monitor = None
         
+        # 批量添加（begin_batch/end_batch 之间的 add_item 延迟落盘和向量化）
+        self._batch_depth = 0
+        self._batch_items: List[KnowledgeItem] = []
+        
         self._load_from_file()
     
     def _get_perf_monitor(self):
@@ -373,6 +431,7 @@ class KnowledgeStore:
                 self.__class__._cache_mtime = None
                 self.__class__._cache_raw_items = None
             logger.info("知识库已保存，共 %s 条", len(self.items))
+            _invalidate_statistics()
         except TimeoutError:
             logger.error("保存知识库失败：无法获取文件锁")
         except Exception as e:
@@ -1158,41 +1217,106 @@ class KnowledgeStore:
     
     def add_item(self, question: str, answer: str, keywords: List[str], category: str = "通用") -> KnowledgeItem:
         """添加知识条目"""
-        # 性能监控
-        perf = self._get_perf_monitor()
-        if perf:
-            perf.record("knowledge_add", 0.0, True)
-        
-        # 生成新ID
-        max_id = 0
-        for item in self.items:
-            try:
-                num = int(item.id[1:])
-                max_id = max(max_id, num)
-            except:
-                pass
-        item_id = f"K{max_id + 1:03d}"
-        
-        item = KnowledgeItem(
-            id=item_id,
-            question=question,
-            answer=answer,
-            keywords=keywords,
-            category=category
-        )
-        self.items.append(item)
-        self._save_to_file()
-        
-        # 更新倒排索引
-        self._update_inverted_index(item, remove=False)
-        
-        # 同步更新向量索引
-        self._add_to_vector_index(item)
+        with self._lock:
+            # 性能监控
+            perf = self._get_perf_monitor()
+            if perf:
+                perf.record("knowledge_add", 0.0, True)
+            
+            # 生成新ID
+            max_id = 0
+            for item in self.items:
+                try:
+                    num = int(item.id[1:])
+                    max_id = max(max_id, num)
+                except:
+                    pass
+            item_id = f"K{max_id + 1:03d}"
+            
+            item = KnowledgeItem(
+                id=item_id,
+                question=question,
+                answer=answer,
+                keywords=keywords,
+                category=category
+            )
+            self.items.append(item)
+            
+            # 更新倒排索引
+            self._update_inverted_index(item, remove=False)
+            
+            if self._batch_depth > 0:
+                # 批量模式：落盘和向量化推迟到 end_batch
+                self._batch_items.append(item)
+                return item
+            
+            self._save_to_file()
+            
+            # 同步更新向量索引
+            self._add_to_vector_index(item)
+            
+            return item
+    
+    def upsert_item(self, item_id: str, question: str, answer: str,
+                    keywords: List[str], category: str = "通用") -> KnowledgeItem:
+        """按指定ID添加或更新知识条目（商品同步使用）"""
+        with self._lock:
+            existing = self.get_item_by_id(item_id)
+            if existing:
+                self.update_item(
+                    item_id,
+                    question=question,
+                    answer=answer,
+                    keywords=keywords,
+                    category=category
+                )
+                return existing
+            
+            item = KnowledgeItem(
+                id=item_id,
+                question=question,
+                answer=answer,
+                keywords=keywords,
+                category=category
+            )
+            self.items.append(item)
+            self._update_inverted_index(item, remove=False)
+            self._save_to_file()
+            self._add_to_vector_index(item)
+            return item
+    
+    def begin_batch(self):
+        """开始批量添加
         
-        return item
+        之后的 add_item 只更新内存和倒排索引，文件保存与向量索引更新
+        推迟到 end_batch 一次完成。支持嵌套，最外层 end_batch 时提交。
+        """
+        with self._lock:
+            self._batch_depth += 1
+    
+    def end_batch(self):
+        """结束批量添加：保存一次文件，并对本批条目一次性向量化"""
+        with self._lock:
+            if self._batch_depth <= 0:
+                return
+            self._batch_depth -= 1
+            if self._batch_depth > 0:
+                return
+            
+            items = self._batch_items
+            self._batch_items = []
+            if not items:
+                return
+            
+            self._save_to_file()
+            self._add_items_to_vector_index(items)
     
     def _add_to_vector_index(self, item: KnowledgeItem):
         """将知识条目添加到向量索引"""
+        self._add_items_to_vector_index([item])
+    
+    def _add_items_to_vector_index(self, items: List[KnowledgeItem]):
+        """将多个知识条目添加到向量索引（合并为一次向量化请求和一次保存）"""
         self._last_vector_index_error = None
         embedding_client = self._get_embedding_client()
         vector_store = self._get_vector_store()
@@ -1203,78 +1327,86 @@ class KnowledgeStore:
         if not embedding_client.is_available():
             return
         
-        try:
-            vector_store.remove_vector(item.id)
-            vector_store.remove_vectors_by_prefix(f"{item.id}#")
-        except Exception:
-            pass
-
-        text = self._item_base_text(item)
-        chunks = self._chunk_text(text)
         max_chunks = int(self.config.get("chunk_max_per_item", 6) or 6)
-        chunks = [c for c in (chunks[:max(1, max_chunks)] if chunks else [text]) if c]
-        if not chunks:
+        chunk_texts: List[str] = []
+        chunk_ids: List[str] = []
+        for item in items:
+            try:
+                vector_store.remove_vector(item.id)
+                vector_store.remove_vectors_by_prefix(f"{item.id}#")
+            except Exception:
+                pass
+
+            text = self._item_base_text(item)
+            chunks = self._chunk_text(text)
+            chunks = [c for c in (chunks[:max(1, max_chunks)] if chunks else [text]) if c]
+            for i, c in enumerate(chunks):
+                chunk_texts.append(c)
+                chunk_ids.append(self._make_chunk_id(item.id, i))
+        if not chunk_texts:
             return
 
-        vecs = embedding_client.embed_texts(chunks)
-        if not vecs or len(vecs) != len(chunks):
+        vecs = embedding_client.embed_texts(chunk_texts)
+        if not vecs or len(vecs) != len(chunk_texts):
             return
 
-        for i, vec in enumerate(vecs):
+        for cid, vec in zip(chunk_ids, vecs):
             if not vec:
                 continue
-            cid = self._make_chunk_id(item.id, i)
             ok = vector_store.add_vector(cid, vec)
             if not ok:
                 last_error = getattr(vector_store, "last_error", None)
                 if isinstance(last_error, dict):
                     self._last_vector_index_error = last_error
-                logger.warning("向量索引未更新: %s", item.id)
+                logger.warning("向量索引未更新: %s", cid.split("#", 1)[0])
                 return
 
         vector_store.save()
-        logger.info("已添加向量索引: %s", item.id)
+        logger.info("已添加向量索引: %s", ", ".join(item.id for item in items))
     
     def delete_item(self, item_id: str) -> bool:
         """删除知识条目"""
-        for i, item in enumerate(self.items):
-            if item.id == item_id:
-                # 先更新倒排索引
-                self._update_inverted_index(item, remove=True)
-                
-                del self.items[i]
-                self._save_to_file()
-                
-                # 同步删除向量索引
-                vector_store = self._get_vector_store()
-                if vector_store:
-                    vector_store.remove_vector(item_id)
-                    vector_store.remove_vectors_by_prefix(f"{item_id}#")
-                    vector_store.save()
-                
-                return True
-        return False
+        with self._lock:
+            for i, item in enumerate(self.items):
+                if item.id == item_id:
+                    # 先更新倒排索引
+                    self._update_inverted_index(item, remove=True)
+                    
+                    del self.items[i]
+                    self._save_to_file()
+                    
+                    # 同步删除向量索引
+                    vector_store = self._get_vector_store()
+                    if vector_store:
+                        vector_store.remove_vector(item_id)
+                        vector_store.remove_vectors_by_prefix(f"{item_id}#")
+                        vector_store.save()
+                    
+                    return True
+            return False
     
     def update_item(self, item_id: str, **kwargs) -> bool:
         """更新知识条目"""
-        for item in self.items:
-            if item.id == item_id:
-                # 先从倒排索引中移除旧数据
-                self._update_inverted_index(item, remove=True)
-                
-                for key, value in kwargs.items():
-                    if hasattr(item, key):
-                        setattr(item, key, value)
-                self._save_to_file()
-                
-                # 添加新数据到倒排索引
-                self._update_inverted_index(item, remove=False)
-                
-                # 重新索引向量
-                self._add_to_vector_index(item)
-                
-                return True
-        return False
+        with self._lock:
+            for item in self.items:
+                if item.id == item_id:
+                    # 先从倒排索引中移除旧数据
+                    self._update_inverted_index(item, remove=True)
+                    
+                    for key, value in kwargs.items():
+                        if hasattr(item, key):
+                            setattr(item, key, value)
+                    item.invalidate_cache()
+                    self._save_to_file()
+                    
+                    # 添加新数据到倒排索引
+                    self._update_inverted_index(item, remove=False)
+                    
+                    # 重新索引向量
+                    self._add_to_vector_index(item)
+                    
+                    return True
+            return False
     
     def rebuild_vector_index(self, progress_callback: Callable[[str, int, int], None] = None) -> Tuple[bool, str]:
         """重建向量索引"""
@@ -1298,9 +1430,13 @@ class KnowledgeStore:
         
         max_chunks = int(self.config.get("chunk_max_per_item", 6) or 6)
 
+        # 重建在工作线程中执行，只在锁内取条目快照，向量化期间不阻塞其它修改
+        with self._lock:
+            items = list(self.items)
+
         chunk_texts: List[str] = []
         chunk_ids: List[str] = []
-        for item in self.items:
+        for item in items:
             text = self._item_base_text(item)
             chunks = self._chunk_text(text)
             chunks = [c for c in (chunks[:max(1, max_chunks)] if chunks else [text]) if c]
@@ -1328,7 +1464,7 @@ class KnowledgeStore:
                 progress_callback("写入索引", i + 1, max(len(chunk_texts), 1))
 
         vector_store.save()
-        return True, f"成功索引 {len(self.items)} 条知识（{wrote} 个chunk向量）"
+        return True, f"成功索引 {len(items)} 条知识（{wrote} 个chunk向量）"
     
     def get_all_items(self) -> List[KnowledgeItem]:
         """获取所有条目"""
@@ -1340,9 +1476,11 @@ class KnowledgeStore:
     
     def reload(self):
         """重新加载知识库"""
-        self._load_from_file()
-        # 重建倒排索引
-        self._build_inverted_index()
+        with self._lock:
+            self._load_from_file()
+            # 重建倒排索引
+            self._build_inverted_index()
+            _invalidate_statistics()
 
 
 class ProductStore:
@@ -1361,6 +1499,9 @@ class ProductStore:
             return
         self._initialized = True
         self.products: List[ProductItem] = []
+        # 各分类商品数量和分类索引（随增删改增量维护）
+        self.category_counts: Counter = Counter()
+        self._by_category: Dict[str, List[ProductItem]] = defaultdict(list)
         self._data_file = self._get_data_file()
         self._knowledge_store = None
         self._load_from_file()
@@ -1392,6 +1533,10 @@ class ProductStore:
         else:
             self.products = []
             self._save_to_file()
+        self.category_counts = Counter(product.category for product in self.products)
+        self._by_category = defaultdict(list)
+        for product in self.products:
+            self._by_category[product.category].append(product)
     
     def _save_to_file(self):
         """保存商品到JSON文件（带文件锁）"""
@@ -1444,6 +1589,8 @@ class ProductStore:
             keywords=keywords or []
         )
         self.products.append(product)
+        self.category_counts[category] += 1
+        self._by_category[category].append(product)
         self._save_to_file()
         
         # 同步添加知识条目
@@ -1457,31 +1604,14 @@ class ProductStore:
         knowledge_items = product.generate_knowledge_items()
         
         for i, item_data in enumerate(knowledge_items, 1):
-            # 使用特殊ID格式：商品ID_K序号
-            item_id = f"{product.id}_K{i}"
-            
-            # 检查是否已存在，如果存在则更新
-            existing = knowledge_store.get_item_by_id(item_id)
-            if existing:
-                knowledge_store.update_item(
-                    item_id,
-                    question=item_data["question"],
-                    answer=item_data["answer"],
-                    keywords=item_data["keywords"],
-                    category=item_data["category"]
-                )
-            else:
-                # 手动创建知识条目
-                new_item = KnowledgeItem(
-                    id=item_id,
-                    question=item_data["question"],
-                    answer=item_data["answer"],
-                    keywords=item_data["keywords"],
-                    category=item_data["category"]
-                )
-                knowledge_store.items.append(new_item)
-                knowledge_store._save_to_file()
-                knowledge_store._add_to_vector_index(new_item)
+            # 使用特殊ID格式：商品ID_K序号；已存在则更新（在知识库的修改锁内完成）
+            knowledge_store.upsert_item(
+                f"{product.id}_K{i}",
+                question=item_data["question"],
+                answer=item_data["answer"],
+                keywords=item_data["keywords"],
+                category=item_data["category"]
+            )
 
         logger.info("已同步商品 %s 的 %s 条知识", product.id, len(knowledge_items))
     
@@ -1490,6 +1620,8 @@ class ProductStore:
         for i, product in enumerate(self.products):
             if product.id == product_id:
                 del self.products[i]
+                self._decrement_category(product.category)
+                self._remove_from_category_index(product)
                 self._save_to_file()
                 
                 # 同步删除知识条目
@@ -1498,6 +1630,27 @@ class ProductStore:
                 return True
         return False
     
+    def _decrement_category(self, category: str):
+        """分类商品数减一，减到0时移除该分类"""
+        count = self.category_counts[category] - 1
+        if count > 0:
+            self.category_counts[category] = count
+        else:
+            del self.category_counts[category]
+    
+    def _remove_from_category_index(self, product: ProductItem, category: str = None):
+        """从分类索引中移除商品，分类为空时移除该分类"""
+        category = product.category if category is None else category
+        bucket = self._by_category.get(category)
+        if not bucket:
+            return
+        for i, item in enumerate(bucket):
+            if item is product:
+                del bucket[i]
+                break
+        if not bucket:
+            del self._by_category[category]
+    
     def _remove_product_knowledge(self, product_id: str):
         """删除商品对应的知识条目"""
         knowledge_store = self._get_knowledge_store()
@@ -1512,9 +1665,16 @@ class ProductStore:
         """更新商品"""
         for product in self.products:
             if product.id == product_id:
+                old_category = product.category
                 for key, value in kwargs.items():
                     if hasattr(product, key):
                         setattr(product, key, value)
+                product.refresh_display()
+                if product.category != old_category:
+                    self._decrement_category(old_category)
+                    self.category_counts[product.category] += 1
+                    self._remove_from_category_index(product, old_category)
+                    self._by_category[product.category].append(product)
                 self._save_to_file()
                 
                 # 重新同步知识条目
@@ -1531,6 +1691,10 @@ class ProductStore:
                 return product
         return None
     
+    def get_by_category(self, category: str) -> List[ProductItem]:
+        """获取指定分类的商品（按分类索引查找）"""
+        return list(self._by_category.get(category, ()))
+    
     def get_all_products(self) -> List[ProductItem]:
         """获取所有商品"""
         return self.products.copy()
@@ -1559,7 +1723,8 @@ class ProductStore:
         success_count = 0
         fail_count = 0
         
-        for product in self.products:
+        # 遍历快照：同步可能在后台线程执行，避免与界面线程的增删改冲突
+        for product in list(self.products):
             try:
                 self._sync_product_to_knowledge(product)
                 success_count += 1
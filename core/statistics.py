@@ -6,14 +6,19 @@
 
 import os
 import json
+import time
 import logging
+from functools import partial
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from collections import Counter
 
 logger = logging.getLogger(__name__)
 
+# 统计结果缓存有效期（秒），有效期内重复刷新直接复用上次的汇总结果
+_CACHE_TTL = 10.0
+
 
 @dataclass
 class UsageStats:
@@ -72,6 +77,8 @@ class StatisticsManager:
         self._data_dir = self._get_data_dir()
         self._stats_file = os.path.join(self._data_dir, "statistics.json")
         self._question_counter: Counter = Counter()
+        # 统计结果缓存：(方法名, 参数) -> (计算时刻, 数据戳, 结果)
+        self._cache: Dict[Tuple, Tuple[float, Any, Any]] = {}
         self._load_stats()
     
     def _get_data_dir(self) -> str:
@@ -104,18 +111,50 @@ class StatisticsManager:
         except Exception as e:
             logger.exception("保存统计数据失败")
     
+    def invalidate(self):
+        """清空统计结果缓存（数据发生变化后调用，下次获取时重新汇总）"""
+        self._cache.clear()
+    
+    def _cached(self, key: Tuple, compute, stamp=None):
+        """在有效期内且数据戳未变时返回缓存的统计结果，否则重新计算并缓存"""
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and now - hit[0] < _CACHE_TTL and hit[1] == stamp:
+            return hit[2]
+        value = compute()
+        self._cache[key] = (now, stamp, value)
+        return value
+    
+    def _users_file_stamp(self):
+        """用户文件的修改时间（用户管理页面和权限管理器直接写该文件，以此判断用户数是否变化）"""
+        try:
+            return os.stat(os.path.join(self._data_dir, "users.json")).st_mtime_ns
+        except OSError:
+            return None
+    
     def record_question(self, question: str):
         """记录问题（用于热门问题统计）"""
         # 简化问题（去除标点，截断）
         simplified = question.strip()[:50]
         if simplified:
             self._question_counter[simplified] += 1
+            self.invalidate()
             # 定期保存
             if sum(self._question_counter.values()) % 10 == 0:
                 self._save_stats()
     
     def get_usage_stats(self) -> UsageStats:
-        """获取使用统计"""
+        """获取使用统计（结果在有效期内缓存，返回副本）"""
+        stats = self._cached(("usage",), self._compute_usage_stats, self._users_file_stamp())
+        return replace(
+            stats,
+            knowledge_by_category=dict(stats.knowledge_by_category),
+            products_by_category=dict(stats.products_by_category),
+            top_questions=list(stats.top_questions),
+        )
+    
+    def _compute_usage_stats(self) -> UsageStats:
+        """汇总使用统计"""
         stats = UsageStats()
         
         try:
@@ -235,7 +274,12 @@ class StatisticsManager:
             return None
     
     def get_daily_stats(self, days: int = 7) -> List[Dict[str, Any]]:
-        """获取每日统计（最近N天）"""
+        """获取每日统计（最近N天，结果在有效期内缓存，返回副本）"""
+        daily = self._cached(("daily", days), partial(self._compute_daily_stats, days))
+        return [dict(d) for d in daily]
+    
+    def _compute_daily_stats(self, days: int) -> List[Dict[str, Any]]:
+        """汇总每日统计"""
         daily_stats = []
         
         try:
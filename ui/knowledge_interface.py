@@ -3,15 +3,21 @@
 知识库管理界面 - 简化版（删除无用指标）
 
 优化内容 (v2.3.0):
-- 使用 ProgressThrottler 节流进度更新，避免UI卡顿
+- 重建索引进度由UI线程定时轮询，避免跨线程信号频繁投递导致UI卡顿
 """
 
+from functools import partial
+from types import MappingProxyType
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFrame,
     QScrollArea, QTableWidgetItem, QHeaderView, 
-    QAbstractItemView, QDialog, QFormLayout
+    QAbstractItemView, QDialog, QFormLayout, QListWidgetItem
+)
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QThread, QObject, QTimer,
+    QMetaObject, QCoreApplication
 )
-from PySide6.QtCore import Qt, Signal, QThread, QObject
 
 from qfluentwidgets import (
     CardWidget, BodyLabel, TitleLabel, SubtitleLabel,
@@ -22,41 +28,131 @@ from qfluentwidgets import (
 )
 
 from core.shared_data import KnowledgeStore, KnowledgeItem
-from core.ui_utils import ProgressThrottler
+from core.ui_utils import BatchUpdater
 from core.validators import KnowledgeValidator
 from core.search import AdvancedSearch, SearchMode
+from ui.widgets import DeleteButtonDelegate
+
+
+# 知识分类（对话框下拉选项）
+_CATEGORY_CHOICES = ("售后政策", "物流配送", "促销活动", "商品咨询", "支付问题", "服务咨询", "订单咨询", "商品信息", "通用")
+
+# 分类图标
+_CAT_ICONS = MappingProxyType({
+    "售后政策": "🔄",
+    "物流配送": "🚚",
+    "促销活动": "🎉",
+    "商品咨询": "📦",
+    "支付问题": "💳",
+    "服务咨询": "💁",
+    "订单咨询": "🧾",
+    "通用": "📝"
+})
+
+# 搜索模式
+_SEARCH_MODE_MAP = MappingProxyType({
+    "包含": SearchMode.CONTAINS,
+    "精确": SearchMode.EXACT,
+    "模糊": SearchMode.FUZZY,
+    "前缀": SearchMode.PREFIX
+})
+
+# 样式表常量（模块加载时构建一次，各面板实例共享）
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #FAFAFA;
+    }
+    QLabel {
+        color: #333333;
+    }
+"""
+
+_TREE_PANEL_QSS = """
+    QFrame { 
+        border-right: 1px solid rgba(0,0,0,0.1);
+        background-color: #FAFAFA;
+    }
+"""
+
+_TREE_LIST_QSS = """
+    ListWidget {
+        border: none;
+        background-color: transparent;
+        outline: none;
+    }
+    ListWidget::item {
+        padding: 8px 16px;
+        border-radius: 8px;
+        margin: 1px 0;
+        border: none;
+        outline: none;
+    }
+    ListWidget::item:hover {
+        background-color: rgba(0, 120, 212, 0.1);
+        border: none;
+    }
+    ListWidget::item:selected {
+        background-color: rgba(0, 120, 212, 0.2);
+        color: #0078d4;
+        border: none;
+        outline: none;
+    }
+    ListWidget::item:focus {
+        border: none;
+        outline: none;
+    }
+"""
+
+_DETAIL_PANEL_QSS = "QFrame { border-left: 1px solid rgba(0,0,0,0.1); }"
+
+# 状态刷新合并间隔（毫秒），突发信号下每秒最多刷新5次
+_REFRESH_INTERVAL_MS = 200
+
+# 表格分批填充：每批行数 / 批间隔（毫秒），保证大知识库加载时事件循环不被阻塞
+_TABLE_CHUNK_ROWS = 200
+_TABLE_CHUNK_INTERVAL_MS = 16
+
+_TOOLBAR_QSS = """
+    PublishToolbar { 
+        border: none;
+        border-top: 1px solid rgba(0,0,0,0.1);
+        background-color: #FAFAFA;
+    }
+"""
+
+
+def _join_thread(thread: QThread, *args):
+    """退出并等待工作线程结束（所属面板销毁前调用，避免销毁仍在运行的线程）"""
+    thread.quit()
+    thread.wait()
 
 
 class RebuildIndexWorker(QObject):
-    """重建索引工作线程"""
+    """重建索引工作线程
+    
+    进度不通过信号发送，而是写入共享状态，由UI线程定时读取
+    （见 progress_snapshot），避免每次进度更新都产生跨线程事件。
+    """
     finished = Signal(bool, str)
     failed = Signal(str)
-    progress = Signal(str, int, int)
 
     def __init__(self):
         super().__init__()
-        self._throttler = None
+        # 整体替换元组，读取方不会看到不一致的中间状态
+        self._progress = ("", 0, 1)
+
+    def progress_snapshot(self) -> tuple:
+        """获取当前进度 (stage, current, total)"""
+        return self._progress
 
+    @Slot()
     def run(self):
+        self._progress = ("", 0, 1)
         try:
-            # 创建节流器，限制进度更新频率
-            # min_interval=0.1: 最多每100ms更新一次
-            # min_progress_change=0.02: 进度变化超过2%才更新
-            self._throttler = ProgressThrottler(
-                callback=lambda stage, current, total: self.progress.emit(str(stage), int(current), int(total)),
-                min_interval=0.1,
-                min_progress_change=0.02
-            )
+            def progress_cb(stage: str, current: int, total: int):
+                self._progress = (str(stage), int(current), int(total))
 
-            def throttled_cb(stage: str, current: int, total: int):
-                self._throttler.update(stage, current, total)
-
-            success, message = KnowledgeStore().rebuild_vector_index(progress_callback=throttled_cb)
-            
-            # 确保最后一次进度更新被发送
-            if self._throttler:
-                self._throttler.finish()
-            
+            success, message = KnowledgeStore().rebuild_vector_index(progress_callback=progress_cb)
             self.finished.emit(bool(success), str(message))
         except Exception as e:
             self.failed.emit(str(e))
@@ -74,14 +170,7 @@ class AddKnowledgeDialog(QDialog):
         self.setFixedSize(550, 450)
         self.setModal(True)  # 设置为模态对话框
         self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)  # 置顶显示
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #FAFAFA;
-            }
-            QLabel {
-                color: #333333;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -122,7 +211,7 @@ class AddKnowledgeDialog(QDialog):
         meta_layout.addRow("🏷️ 关键词：", self.keywords_edit)
         
         self.category_combo = ComboBox()
-        self.category_combo.addItems(["售后政策", "物流配送", "促销活动", "商品咨询", "支付问题", "服务咨询", "订单咨询", "商品信息", "通用"])
+        self.category_combo.addItems(list(_CATEGORY_CHOICES))
         meta_layout.addRow("📁 分类：", self.category_combo)
         
         layout.addWidget(meta_card)
@@ -209,12 +298,7 @@ class KnowledgeTreePanel(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedWidth(240)
-        self.setStyleSheet("""
-            QFrame { 
-                border-right: 1px solid rgba(0,0,0,0.1);
-                background-color: #FAFAFA;
-            }
-        """)
+        self.setStyleSheet(_TREE_PANEL_QSS)
         
         self.knowledge_store = KnowledgeStore()
         
@@ -228,72 +312,43 @@ class KnowledgeTreePanel(QFrame):
         
         # 分类列表
         self.list_widget = ListWidget()
-        self.list_widget.setStyleSheet("""
-            ListWidget {
-                border: none;
-                background-color: transparent;
-                outline: none;
-            }
-            ListWidget::item {
-                padding: 8px 16px;
-                border-radius: 8px;
-                margin: 1px 0;
-                border: none;
-                outline: none;
-            }
-            ListWidget::item:hover {
-                background-color: rgba(0, 120, 212, 0.1);
-                border: none;
-            }
-            ListWidget::item:selected {
-                background-color: rgba(0, 120, 212, 0.2);
-                color: #0078d4;
-                border: none;
-                outline: none;
-            }
-            ListWidget::item:focus {
-                border: none;
-                outline: none;
-            }
-        """)
+        self.list_widget.setStyleSheet(_TREE_LIST_QSS)
         self.list_widget.itemClicked.connect(self._on_item_clicked)
         layout.addWidget(self.list_widget, 1)
         
-        self._load_data()
+        self._refresh_updater = BatchUpdater(self._load_data, interval_ms=_REFRESH_INTERVAL_MS)
+        
+        # 首次加载推迟到事件循环，先完成窗口绘制；占位项不可选中、不响应点击
+        placeholder = QListWidgetItem("加载中...")
+        placeholder.setFlags(Qt.NoItemFlags)
+        self.list_widget.addItem(placeholder)
+        QTimer.singleShot(0, self._load_data)
     
     def _load_data(self):
         self.list_widget.clear()
         
+        items = self.knowledge_store.items
+        
         # 全部
-        total = len(self.knowledge_store.items)
+        total = len(items)
         self.list_widget.addItem(f"📋 全部知识 ({total})")
         
         # 分类统计
         categories = {}
-        for item in self.knowledge_store.items:
+        for item in items:
             cat = item.category
             categories[cat] = categories.get(cat, 0) + 1
         
-        # 分类图标
-        cat_icons = {
-            "售后政策": "🔄",
-            "物流配送": "🚚",
-            "促销活动": "🎉",
-            "商品咨询": "📦",
-            "支付问题": "💳",
-            "服务咨询": "💁",
-            "订单咨询": "🧾",
-            "通用": "📝"
-        }
-        
         for cat, count in sorted(categories.items()):
-            icon = cat_icons.get(cat, "📁")
+            icon = _CAT_ICONS.get(cat, "📁")
             self.list_widget.addItem(f"{icon} {cat} ({count})")
     
     def refresh(self):
-        self._load_data()
+        self._refresh_updater.request_update()
     
     def _on_item_clicked(self, item):
+        if not item.flags() & Qt.ItemIsEnabled:
+            return
         text = item.text()
         if "全部知识" in text:
             self.category_selected.emit("全部")
@@ -318,6 +373,7 @@ class DocumentListPanel(QFrame):
         
         self.knowledge_store = KnowledgeStore()
         self.current_items = []
+        self._current_category = "全部"
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -337,7 +393,7 @@ class DocumentListPanel(QFrame):
         
         # 搜索模式选择
         self.search_mode = ComboBox()
-        self.search_mode.addItems(["包含", "精确", "模糊", "前缀"])
+        self.search_mode.addItems(list(_SEARCH_MODE_MAP))
         self.search_mode.setFixedWidth(80)
         self.search_mode.currentTextChanged.connect(lambda: self._on_search(self.search.text()))
         top.addWidget(self.search_mode)
@@ -361,20 +417,37 @@ class DocumentListPanel(QFrame):
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.cellClicked.connect(self._on_row_clicked)
         
+        # 操作列使用委托绘制删除图标
+        self._delete_delegate = DeleteButtonDelegate(self.table)
+        self._delete_delegate.delete_clicked.connect(self._on_delete_clicked)
+        self.table.setItemDelegateForColumn(4, self._delete_delegate)
+        
         layout.addWidget(self.table, 1)
         
-        self._load_all()
+        # 分批填充定时器
+        self._fill_pos = 0
+        self._fill_timer = QTimer(self)
+        self._fill_timer.setInterval(_TABLE_CHUNK_INTERVAL_MS)
+        self._fill_timer.timeout.connect(self._fill_next_chunk)
+        
+        # 首次加载推迟到事件循环，先完成窗口绘制
+        self.table.setRowCount(1)
+        self.table.setItem(0, 1, QTableWidgetItem("加载中..."))
+        QTimer.singleShot(0, self._load_all)
     
     def _load_all(self):
+        self._current_category = "全部"
         self.current_items = self.knowledge_store.get_all_items()
         self._refresh_table()
     
     def load_by_category(self, category: str):
         # 不修改标题，避免UI重叠
+        self._current_category = category
         if category == "全部":
             self.current_items = self.knowledge_store.get_all_items()
         else:
-            self.current_items = [i for i in self.knowledge_store.items if i.category == category]
+            items = self.knowledge_store.items
+            self.current_items = [i for i in items if i.category == category]
         self._refresh_table()
     
     def _on_search(self, text: str):
@@ -382,13 +455,7 @@ class DocumentListPanel(QFrame):
             self._load_all()
         else:
             # 获取搜索模式
-            mode_map = {
-                "包含": SearchMode.CONTAINS,
-                "精确": SearchMode.EXACT,
-                "模糊": SearchMode.FUZZY,
-                "前缀": SearchMode.PREFIX
-            }
-            mode = mode_map.get(self.search_mode.currentText(), SearchMode.CONTAINS)
+            mode = _SEARCH_MODE_MAP.get(self.search_mode.currentText(), SearchMode.CONTAINS)
             
             # 使用高级搜索
             searcher = AdvancedSearch(
@@ -400,22 +467,72 @@ class DocumentListPanel(QFrame):
         self._refresh_table()
     
     def _refresh_table(self):
+        self._fill_timer.stop()
+        # 先清空旧单元格：分批填充到达之前，行中不能残留上一次列表的文本，
+        # 否则显示内容与点击/删除实际对应的 current_items[row] 不一致
+        self.table.clearContents()
         self.table.setRowCount(len(self.current_items))
         
-        for i, item in enumerate(self.current_items):
-            self.table.setItem(i, 0, QTableWidgetItem(item.id))
-            q_text = item.question[:35] + "..." if len(item.question) > 35 else item.question
-            self.table.setItem(i, 1, QTableWidgetItem(q_text))
-            self.table.setItem(i, 2, QTableWidgetItem(item.category))
-            self.table.setItem(i, 3, QTableWidgetItem(", ".join(item.keywords[:3])))
-            self.table.setItem(i, 4, QTableWidgetItem("🗑️ 删除"))
+        self._fill_pos = 0
+        self._fill_next_chunk()
+        if self._fill_pos < len(self.current_items):
+            self._fill_timer.start()
+    
+    def _fill_next_chunk(self):
+        """填充下一批表格行"""
+        end = min(self._fill_pos + _TABLE_CHUNK_ROWS, len(self.current_items))
+        for i in range(self._fill_pos, end):
+            self._set_row(i, self.current_items[i])
+        self._fill_pos = end
+        if end >= len(self.current_items):
+            self._fill_timer.stop()
+    
+    def _finish_fill(self):
+        """立即填充剩余行（增量修改前调用，保证行号与 current_items 一致）"""
+        if self._fill_timer.isActive():
+            self._fill_timer.stop()
+            for i in range(self._fill_pos, len(self.current_items)):
+                self._set_row(i, self.current_items[i])
+            self._fill_pos = len(self.current_items)
+    
+    def _set_row(self, i: int, item: KnowledgeItem):
+        """填充单行数据"""
+        self.table.setItem(i, 0, QTableWidgetItem(item.id))
+        self.table.setItem(i, 1, QTableWidgetItem(item.cached_short_question))
+        self.table.setItem(i, 2, QTableWidgetItem(item.category))
+        self.table.setItem(i, 3, QTableWidgetItem(", ".join(item.keywords[:3])))
+    
+    def _is_filtered(self) -> bool:
+        """当前是否处于搜索或分类过滤状态"""
+        return bool(self.search.text()) or self._current_category != "全部"
+    
+    def _append_row(self, item: KnowledgeItem):
+        """增量追加一行（过滤状态下新条目未必匹配，回退为全量加载）"""
+        if self._is_filtered():
+            self._load_all()
+            return
+        self._finish_fill()
+        self.current_items.append(item)
+        row = len(self.current_items) - 1
+        self.table.insertRow(row)
+        self._set_row(row, item)
+    
+    def _remove_row(self, row: int):
+        """增量删除一行"""
+        self._finish_fill()
+        self.table.removeRow(row)
+        del self.current_items[row]
     
     def _on_row_clicked(self, row: int, column: int):
+        # 操作列的点击由删除委托处理
+        if column == 4:
+            return
         if 0 <= row < len(self.current_items):
-            if column == 4:
-                self._delete_item(row)
-            else:
-                self.item_selected.emit(self.current_items[row])
+            self.item_selected.emit(self.current_items[row])
+    
+    def _on_delete_clicked(self, row: int):
+        if 0 <= row < len(self.current_items):
+            self._delete_item(row)
     
     def _add_knowledge(self):
         """添加知识"""
@@ -425,13 +542,13 @@ class DocumentListPanel(QFrame):
             if result:
                 data = dialog.get_data()
                 if data["question"] and data["answer"]:
-                    self.knowledge_store.add_item(
+                    new_item = self.knowledge_store.add_item(
                         question=data["question"],
                         answer=data["answer"],
                         keywords=data["keywords"],
                         category=data["category"]
                     )
-                    self._load_all()
+                    self._append_row(new_item)
                     self.item_added.emit()
                     index_error = getattr(self.knowledge_store, "last_vector_index_error", None)
                     if isinstance(index_error, dict) and index_error.get("type") == "dimension_mismatch":
@@ -463,13 +580,40 @@ class DocumentListPanel(QFrame):
                 position=InfoBarPosition.TOP
             )
     
+    def add_many(self, items: list) -> list:
+        """批量添加知识（一次保存、一次向量化）
+        
+        Args:
+            items: 字典列表，包含 question/answer/keywords/category
+        
+        Returns:
+            新建的知识条目列表
+        """
+        added = []
+        self.knowledge_store.begin_batch()
+        try:
+            for data in items:
+                added.append(self.knowledge_store.add_item(
+                    question=data["question"],
+                    answer=data["answer"],
+                    keywords=data.get("keywords", []),
+                    category=data.get("category", "通用")
+                ))
+        finally:
+            self.knowledge_store.end_batch()
+        
+        if added:
+            self._load_all()
+            self.item_added.emit()
+        return added
+    
     def _delete_item(self, row: int):
         item = self.current_items[row]
         
         w = MessageBox("确认删除", f"确定要删除知识 {item.id} 吗？\n\n问题：{item.question[:30]}...", self)
         if w.exec():
             self.knowledge_store.delete_item(item.id)
-            self._load_all()
+            self._remove_row(row)
             self.item_deleted.emit(item.id)
             InfoBar.success(
                 title="删除成功",
@@ -488,7 +632,7 @@ class DocumentDetailPanel(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedWidth(350)
-        self.setStyleSheet("QFrame { border-left: 1px solid rgba(0,0,0,0.1); }")
+        self.setStyleSheet(_DETAIL_PANEL_QSS)
         
         from core.config import Config
         from core.shared_data import KnowledgeStore
@@ -499,6 +643,12 @@ class DocumentDetailPanel(QFrame):
         self._rebuild_running = False
         self._rebuild_thread: QThread | None = None
         self._rebuild_worker: RebuildIndexWorker | None = None
+        self._last_progress: tuple | None = None
+        
+        # 重建进度轮询（10Hz）
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._poll_rebuild_progress)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -581,8 +731,10 @@ class DocumentDetailPanel(QFrame):
         
         layout.addWidget(config_card)
         
+        self._status_updater = BatchUpdater(self._do_update_index_status, interval_ms=_REFRESH_INTERVAL_MS)
+        
         # 更新索引状态
-        self._update_index_status()
+        self._do_update_index_status()
     
     def _edit_item(self):
         """编辑知识"""
@@ -687,19 +839,19 @@ class DocumentDetailPanel(QFrame):
         self.rebuild_btn.setText("重建中...")
         self.index_status.setText("📊 索引状态: 重建中...")
 
-        self._rebuild_thread = QThread()
-        self._rebuild_worker = RebuildIndexWorker()
-        self._rebuild_worker.moveToThread(self._rebuild_thread)
+        self._ensure_rebuild_thread()
+        QMetaObject.invokeMethod(self._rebuild_worker, "run", Qt.QueuedConnection)
+        self._last_progress = None
+        self._progress_timer.start()
 
-        self._rebuild_thread.started.connect(self._rebuild_worker.run)
-        self._rebuild_worker.finished.connect(self._on_rebuild_finished)
-        self._rebuild_worker.failed.connect(self._on_rebuild_failed)
-        self._rebuild_worker.progress.connect(self._on_rebuild_progress)
-        self._rebuild_worker.finished.connect(self._rebuild_thread.quit)
-        self._rebuild_worker.failed.connect(self._rebuild_thread.quit)
-        self._rebuild_thread.finished.connect(self._cleanup_rebuild_thread)
-
-        self._rebuild_thread.start()
+    def _poll_rebuild_progress(self):
+        if self._rebuild_worker is None:
+            return
+        snapshot = self._rebuild_worker.progress_snapshot()
+        if snapshot == self._last_progress or not snapshot[0]:
+            return
+        self._last_progress = snapshot
+        self._on_rebuild_progress(*snapshot)
 
     def _on_rebuild_progress(self, stage: str, current: int, total: int):
         if total <= 0:
@@ -735,20 +887,39 @@ class DocumentDetailPanel(QFrame):
         self._finish_rebuild_ui()
 
     def _finish_rebuild_ui(self):
+        self._progress_timer.stop()
         self._rebuild_running = False
         self.rebuild_btn.setEnabled(True)
         self.rebuild_btn.setText("重建向量索引")
         self._update_index_status()
 
-    def _cleanup_rebuild_thread(self):
-        if self._rebuild_worker is not None:
-            self._rebuild_worker.deleteLater()
-            self._rebuild_worker = None
+    def _ensure_rebuild_thread(self):
+        """首次重建时创建常驻工作线程，之后的重建复用同一线程"""
+        if self._rebuild_thread is not None:
+            return
+        self._rebuild_thread = QThread(self)
+        self._rebuild_worker = RebuildIndexWorker()
+        self._rebuild_worker.moveToThread(self._rebuild_thread)
+        self._rebuild_worker.finished.connect(self._on_rebuild_finished)
+        self._rebuild_worker.failed.connect(self._on_rebuild_failed)
+        self._rebuild_thread.finished.connect(self._rebuild_worker.deleteLater)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_rebuild_thread)
+        # 管理窗口关闭后面板会随之销毁，destroyed 在子对象销毁前发出，
+        # 此时先结束线程；回调只引用线程本身，不依赖正在销毁的面板
+        self.destroyed.connect(partial(_join_thread, self._rebuild_thread))
+        self._rebuild_thread.start()
+
+    def _stop_rebuild_thread(self):
         if self._rebuild_thread is not None:
-            self._rebuild_thread.deleteLater()
-            self._rebuild_thread = None
+            _join_thread(self._rebuild_thread)
     
     def _update_index_status(self):
+        """请求更新索引状态（合并短时间内的多次请求）"""
+        self._status_updater.request_update()
+    
+    def _do_update_index_status(self):
         """更新索引状态"""
         try:
             from core.vector_store import VectorStore
@@ -821,7 +992,7 @@ class DocumentDetailPanel(QFrame):
         self.title.setText(f"📄 知识详情 - {item.id}")
         self.id_label.setText(f"🆔 ID：{item.id}")
         self.cat_label.setText(f"📁 分类：{item.category}")
-        self.keywords_label.setText(f"🏷️ 关键词：{', '.join(item.keywords)}")
+        self.keywords_label.setText("🏷️ 关键词：" + item.cached_keyword_str)
         self.question_label.setText(item.question)
         self.answer_label.setText(item.answer)
 
@@ -832,13 +1003,7 @@ class PublishToolbar(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(40)
-        self.setStyleSheet("""
-            PublishToolbar { 
-                border: none;
-                border-top: 1px solid rgba(0,0,0,0.1);
-                background-color: #FAFAFA;
-            }
-        """)
+        self.setStyleSheet(_TOOLBAR_QSS)
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(20, 10, 20, 10)
@@ -850,9 +1015,14 @@ class PublishToolbar(QFrame):
         layout.addWidget(self.stats_label)
         
         layout.addStretch()
+        
+        self._stats_updater = BatchUpdater(self._do_refresh_stats, interval_ms=_REFRESH_INTERVAL_MS)
     
     def refresh_stats(self):
-        """刷新统计"""
+        """刷新统计（合并短时间内的多次请求）"""
+        self._stats_updater.request_update()
+    
+    def _do_refresh_stats(self):
         self.stats_label.setText(f"📚 知识库共 {len(KnowledgeStore().items)} 条知识")
 
 
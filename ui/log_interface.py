@@ -4,34 +4,221 @@
 提供日志查看、搜索、清理等功能
 """
 
+import os
+import re
+import shutil
+from collections import deque
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFrame,
-    QSplitter, QFileDialog, QApplication
+    QSplitter, QApplication, QPlainTextEdit
+)
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QObject, QRunnable, QThreadPool, QFileSystemWatcher
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont, QTextCharFormat, QColor, QTextCursor
+from PySide6.QtGui import QFont, QTextCharFormat, QColor, QSyntaxHighlighter
 
 from qfluentwidgets import (
     CardWidget, BodyLabel, TitleLabel, SubtitleLabel,
     PushButton, PrimaryPushButton, ComboBox, SpinBox,
-    SearchLineEdit, TextEdit, ListWidget, FluentIcon,
-    MessageBox, InfoBar, InfoBarPosition, SwitchButton
+    SearchLineEdit, ListWidget, FluentIcon, SwitchButton
 )
 
 from core.logger import LogManager
 
 
+# 两个面板共用的日志管理器（main.py 启动时已通过 setup_logging() 初始化）
+_LOG_MANAGER = LogManager()
+
+# 反向读取日志末尾时每次读取的块大小
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+
+# 日志级别匹配（一次扫描同时匹配全部级别）
+LEVEL_RE = re.compile(r"\| (DEBUG|INFO|WARNING|ERROR|CRITICAL)\b")
+
+# 日志级别颜色
+_LEVEL_COLORS = {
+    "DEBUG": "#6A9955",
+    "INFO": "#4FC1FF",
+    "WARNING": "#DCDCAA",
+    "ERROR": "#F14C4C",
+    "CRITICAL": "#FF0000",
+}
+
+
+def _make_level_format(color: str) -> QTextCharFormat:
+    fmt = QTextCharFormat()
+    fmt.setForeground(QColor(color))
+    return fmt
+
+
+def _fadvise(fd: int, offset: int, length: int, advice: str):
+    """向内核提示文件访问模式（仅 POSIX 系统可用，其余平台忽略）"""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, offset, length, getattr(os, advice))
+    except (OSError, AttributeError):
+        pass
+
+
+# 日志文件列表缓存：(日志目录 st_mtime_ns, 文件列表)
+_files_cache: tuple[int, list] | None = None
+
+
+def _get_log_files(log_manager: LogManager, force: bool = False) -> list:
+    """获取日志文件列表（按日志目录修改时间缓存）
+    
+    目录修改时间只在文件增删、改名（如日志轮转）时变化，
+    未变化时直接复用上次的列表，避免逐个 stat 所有轮转文件。
+    列表中的大小/修改时间可能滞后于正在写入的文件，需要最新值时传 force=True。
+    """
+    global _files_cache
+    try:
+        dir_mtime = os.stat(log_manager.log_dir).st_mtime_ns
+    except OSError:
+        return log_manager.get_log_files()
+    if not force and _files_cache is not None and _files_cache[0] == dir_mtime:
+        return _files_cache[1]
+    files = log_manager.get_log_files()
+    _files_cache = (dir_mtime, files)
+    return files
+
+
+# 导出日志时的复制缓冲区大小
+_EXPORT_CHUNK_SIZE = 1 << 20
+
+
+def _export_log_files(files: list, save_path: str, progress_callback=None):
+    """将日志文件逐个流式写入导出文件，不在内存中拼接全部内容
+    
+    Args:
+        files: get_log_files() 返回的文件列表
+        save_path: 导出文件路径
+        progress_callback: 进度回调 (已完成文件数, 文件总数)
+    """
+    total = len(files)
+    with open(save_path, 'w', encoding='utf-8') as out:
+        for i, f in enumerate(files, 1):
+            out.write(f"{'='*60}\n文件: {f['name']}\n{'='*60}\n")
+            try:
+                with open(f['path'], 'r', encoding='utf-8', errors='replace') as src:
+                    shutil.copyfileobj(src, out, _EXPORT_CHUNK_SIZE)
+            except FileNotFoundError:
+                # 列出后被轮转或清理的文件直接跳过
+                pass
+            out.write("\n\n")
+            if progress_callback:
+                progress_callback(i, total)
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def _format_size(n: int) -> str:
+    """格式化文件大小（按二进制位数直接确定单位）"""
+    i = min(max(0, (n.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    if i == 0:
+        return f"{n} B"
+    return f"{n / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
+
+
+def _decode_log(data: bytes) -> str:
+    """解码日志字节（Windows 下文本模式写入的 CRLF 统一为 LF）"""
+    return data.decode('utf-8', errors='replace').replace('\r\n', '\n')
+
+
+class _ExportWorker(QObject, QRunnable):
+    """日志导出任务（在线程池中执行，避免阻塞界面）"""
+    
+    finished = Signal(str)
+    failed = Signal(str)
+    progress = Signal(int, int)
+    
+    def __init__(self, files: list, save_path: str):
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+        # 由面板持有引用，不交给线程池自动删除
+        self.setAutoDelete(False)
+        self._files = files
+        self._save_path = save_path
+    
+    def run(self):
+        try:
+            _export_log_files(self._files, self._save_path, self.progress.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(self._save_path)
+
+
+class LogLevelHighlighter(QSyntaxHighlighter):
+    """日志级别高亮器
+    
+    按文本块（行）高亮，Qt 只对新增或修改的块调用 highlightBlock，
+    增量追加日志时的开销只与新增行数相关。
+    """
+    
+    # 各级别高亮格式（类级别共享，首次创建高亮器时生成一次）
+    _LEVEL_FORMATS = None
+    
+    def __init__(self, document):
+        super().__init__(document)
+        self._ensure_formats()
+    
+    @classmethod
+    def _ensure_formats(cls):
+        """延迟创建高亮格式，避免在模块导入时构造 Qt 对象"""
+        if cls._LEVEL_FORMATS is None:
+            cls._LEVEL_FORMATS = {
+                name: _make_level_format(color) for name, color in _LEVEL_COLORS.items()
+            }
+    
+    def highlightBlock(self, text: str):
+        formats = self._LEVEL_FORMATS
+        for m in LEVEL_RE.finditer(text):
+            self.setFormat(m.start(), m.end() - m.start(), formats[m.group(1)])
+
+
 class LogViewerPanel(QFrame):
     """日志查看面板"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        self.log_manager = LogManager()
+        self.log_manager = _LOG_MANAGER
         self.current_file = None
         self.auto_refresh = False
+        
+        # 增量读取状态：文件名 -> 已读取到的字节偏移
+        self._tail_offset: dict[str, int] = {}
+        self._tail_lines = 0
+        self._line_count = 0
+        # 上次刷新时文件的 (st_mtime_ns, st_size)，未变化时跳过自动刷新
+        self._last_stat: tuple[int, int] | None = None
+        
+        # 当前加载的日志行（搜索/过滤基于此缓存，避免重复读取文件和文档）
+        self._current_lines: list[str] = []
+        # 与 _current_lines 一一对应的 casefold 结果，搜索时无需逐行重复转换
+        self._current_lines_lower: list[str] = []
+        # 轮询定时器：仅在无法监听文件（如轮转后文件暂不存在）时作为回退
         self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self._refresh_log)
+        self.refresh_timer.timeout.connect(self._on_poll_timeout)
+        
+        # 自动刷新：监听文件变化，200ms 防抖合并连续写入
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.fileChanged.connect(self._on_file_modified)
+        self._watch_timer = QTimer(self)
+        self._watch_timer.setSingleShot(True)
+        self._watch_timer.setInterval(200)
+        self._watch_timer.timeout.connect(self._refresh_log)
+        
+        # 搜索防抖：连续输入时只在停止输入200ms后执行一次过滤
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self._apply_filters)
         
         self._init_ui()
         self._load_log_files()
@@ -74,7 +261,7 @@ class LogViewerPanel(QFrame):
         self.lines_spin = SpinBox()
         self.lines_spin.setRange(50, 5000)
         self.lines_spin.setValue(200)
-        self.lines_spin.valueChanged.connect(self._refresh_log)
+        self.lines_spin.valueChanged.connect(self._on_lines_changed)
         toolbar.addWidget(self.lines_spin)
         
         toolbar.addStretch()
@@ -88,7 +275,7 @@ class LogViewerPanel(QFrame):
         
         # 刷新按钮
         self.refresh_btn = PushButton(FluentIcon.SYNC, "刷新")
-        self.refresh_btn.clicked.connect(self._refresh_log)
+        self.refresh_btn.clicked.connect(lambda: self._refresh_log(force=True))
         toolbar.addWidget(self.refresh_btn)
         
         layout.addLayout(toolbar)
@@ -104,23 +291,26 @@ class LogViewerPanel(QFrame):
         search_row.addWidget(BodyLabel("级别过滤:"))
         self.level_combo = ComboBox()
         self.level_combo.addItems(["全部", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
-        self.level_combo.currentTextChanged.connect(self._filter_by_level)
+        self.level_combo.currentTextChanged.connect(self._apply_filters)
         search_row.addWidget(self.level_combo)
         
         layout.addLayout(search_row)
         
         # 日志内容
-        self.log_text = TextEdit()
+        # 纯文本控件 + 最大块数：超出显示行数的旧行在追加时自动丢弃
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self.lines_spin.value())
         self.log_text.setFont(QFont("Consolas", 9))
         self.log_text.setStyleSheet("""
-            TextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #d4d4d4;
                 border: 1px solid #3c3c3c;
                 border-radius: 4px;
             }
         """)
+        self._highlighter = LogLevelHighlighter(self.log_text.document())
         layout.addWidget(self.log_text, 1)
         
         # 状态栏
@@ -139,124 +329,292 @@ class LogViewerPanel(QFrame):
     def _load_log_files(self):
         """加载日志文件列表"""
         self.file_combo.clear()
-        files = self.log_manager.get_log_files()
+        files = _get_log_files(self.log_manager)
         for f in files:
-            size_str = self._format_size(f["size"])
+            size_str = _format_size(f["size"])
             self.file_combo.addItem(f"{f['name']} ({size_str})", f["name"])
         
         if files:
             self.current_file = files[0]["name"]
-            self._refresh_log()
-    
-    def _format_size(self, size: int) -> str:
-        """格式化文件大小"""
-        if size < 1024:
-            return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        else:
-            return f"{size / 1024 / 1024:.1f} MB"
+            self._refresh_log(force=True)
     
     def _on_file_changed(self, text: str):
         """文件选择变化"""
         index = self.file_combo.currentIndex()
         if index >= 0:
             self.current_file = self.file_combo.itemData(index)
-            self._refresh_log()
+            if self.auto_refresh:
+                self._start_watching()
+            self._refresh_log(force=True)
+    
+    def _on_lines_changed(self, value: int):
+        """显示行数变化"""
+        self.log_text.setMaximumBlockCount(value)
+        self._refresh_log(force=True)
     
-    def _refresh_log(self):
-        """刷新日志内容"""
+    def _log_path(self, filename: str) -> str:
+        return os.path.join(self.log_manager.log_dir, filename)
+    
+    def _tail_file(self, path: str, n_lines: int) -> tuple:
+        """读取文件末尾 n_lines 行
+        
+        从文件末尾按块反向读取，直到凑够所需行数，
+        读取量只与所需行数相关，与文件总大小无关。
+        
+        末尾未写完的行（不以换行结尾）不包含在结果中，留给增量读取。
+        
+        Returns:
+            (文本内容, 最后一个完整行之后的偏移)
+        """
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            end = os.lseek(fd, 0, os.SEEK_END)
+            pos = end
+            blocks = []
+            newlines = 0
+            # 文件以换行结尾时需要多一个换行符才能确定第一行的起点
+            while pos > 0 and newlines <= n_lines:
+                size = min(_TAIL_BLOCK_SIZE, pos)
+                pos -= size
+                if hasattr(os, "pread"):
+                    block = os.pread(fd, size, pos)
+                else:
+                    os.lseek(fd, pos, os.SEEK_SET)
+                    block = os.read(fd, size)
+                blocks.append(block)
+                newlines += block.count(b'\n')
+            # 日志只读一次，读完即释放页缓存，避免挤占更有价值的缓存
+            _fadvise(fd, pos, end - pos, "POSIX_FADV_DONTNEED")
+        finally:
+            os.close(fd)
+        
+        data = b''.join(reversed(blocks))
+        # 只保留到最后一个换行符，偏移也只推进到这里，不完整的行等下次读取
+        complete = data.rfind(b'\n') + 1
+        data = data[:complete]
+        start = complete - 1
+        for _ in range(n_lines):
+            start = data.rfind(b'\n', 0, start)
+            if start < 0:
+                break
+        start = start + 1 if start >= 0 else 0
+        return _decode_log(data[start:]), pos + complete
+    
+    def _read_tail(self, n_lines: int) -> tuple:
+        """读取当前文件末尾N行，失败时返回错误提示"""
+        path = self._log_path(self.current_file)
+        if not os.path.exists(path):
+            return "", None
+        try:
+            return self._tail_file(path, n_lines)
+        except Exception as e:
+            return f"读取日志失败: {e}", None
+    
+    def _is_filtered(self) -> bool:
+        """当前是否处于搜索或级别过滤状态"""
+        return bool(self.search_edit.text()) or self.level_combo.currentText() != "全部"
+    
+    def _refresh_log(self, force: bool = False):
+        """刷新日志内容
+        
+        同一文件、同一行数设置下只追加文件新增部分；
+        切换文件、修改行数或处于过滤状态时重新读取末尾N行。
+        
+        Args:
+            force: 为 False 时若文件修改时间和大小均未变化则直接返回
+        """
         if not self.current_file:
             return
         
         lines = self.lines_spin.value()
-        content = self.log_manager.read_log(self.current_file, lines)
+        path = self._log_path(self.current_file)
+        try:
+            st = os.stat(path)
+            key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+        if key is not None and key == self._last_stat and not force:
+            return
+        self._last_stat = key
+        
+        if (
+            lines == self._tail_lines
+            and self.current_file in self._tail_offset
+            and not self._is_filtered()
+        ):
+            self._append_new_content(path)
+            return
         
-        # 保存当前滚动位置
-        scrollbar = self.log_text.verticalScrollBar()
-        at_bottom = scrollbar.value() >= scrollbar.maximum() - 10
+        self._tail_offset.clear()
+        self._tail_lines = lines
+        content, offset = self._read_tail(lines)
+        content = content.rstrip('\n')
+        self._current_lines = content.split('\n') if content else []
+        self._current_lines_lower = [line.casefold() for line in self._current_lines]
+        self._line_count = len(self._current_lines)
         
-        self.log_text.setPlainText(content)
-        self._highlight_log_levels()
+        if offset is not None:
+            self._tail_offset[self.current_file] = offset
         
-        # 如果之前在底部，保持在底部
-        if at_bottom:
-            scrollbar.setValue(scrollbar.maximum())
+        if self._is_filtered():
+            # 过滤状态下按当前搜索词和级别显示新读取的内容
+            self._apply_filters()
+        else:
+            # 保存当前滚动位置
+            scrollbar = self.log_text.verticalScrollBar()
+            at_bottom = scrollbar.value() >= scrollbar.maximum() - 10
+            
+            self._set_text(content)
+            
+            # 如果之前在底部，保持在底部
+            if at_bottom:
+                scrollbar.setValue(scrollbar.maximum())
+            
+            self.line_count_label.setText(f"{self._line_count} 行")
         
-        # 更新状态
-        line_count = content.count('\n')
-        self.line_count_label.setText(f"{line_count} 行")
         self.status_label.setText(f"已加载: {self.current_file}")
     
-    def _highlight_log_levels(self):
-        """高亮日志级别"""
-        cursor = self.log_text.textCursor()
+    def _append_new_content(self, path: str):
+        """只读取上次偏移之后新写入的完整行并追加显示"""
+        offset = self._tail_offset[self.current_file]
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
         
-        # 定义颜色
-        colors = {
-            "DEBUG": QColor("#6A9955"),
-            "INFO": QColor("#4FC1FF"),
-            "WARNING": QColor("#DCDCAA"),
-            "ERROR": QColor("#F14C4C"),
-            "CRITICAL": QColor("#FF0000"),
-        }
+        if size < offset:
+            # 文件被轮转或截断，重新全量读取
+            self._tail_offset.clear()
+            self._refresh_log(force=True)
+            return
+        if size == offset:
+            return
         
-        text = self.log_text.toPlainText()
+        with open(path, 'rb') as f:
+            fd = f.fileno()
+            _fadvise(fd, offset, 0, "POSIX_FADV_SEQUENTIAL")
+            f.seek(offset)
+            data = f.read(size - offset)
+            _fadvise(fd, offset, size - offset, "POSIX_FADV_DONTNEED")
         
-        for level, color in colors.items():
-            fmt = QTextCharFormat()
-            fmt.setForeground(color)
-            
-            start = 0
-            while True:
-                pos = text.find(f"| {level}", start)
-                if pos == -1:
-                    break
-                
-                cursor.setPosition(pos)
-                cursor.movePosition(QTextCursor.Right, QTextCursor.KeepAnchor, len(level) + 2)
-                cursor.mergeCharFormat(fmt)
-                start = pos + 1
-    
-    def _on_search(self, text: str):
-        """搜索日志"""
-        if not text:
-            self._refresh_log()
+        # 只处理到最后一个换行符，不完整的行留到下次
+        end = data.rfind(b'\n')
+        if end < 0:
             return
+        self._tail_offset[self.current_file] = offset + end + 1
+        chunk = _decode_log(data[:end])
+        new_lines = chunk.split('\n')
+        self._current_lines.extend(new_lines)
+        self._current_lines_lower.extend(line.casefold() for line in new_lines)
+        if len(self._current_lines) > self._tail_lines:
+            del self._current_lines[:-self._tail_lines]
+            del self._current_lines_lower[:-self._tail_lines]
         
-        content = self.log_text.toPlainText()
-        lines = content.split('\n')
-        filtered = [line for line in lines if text.lower() in line.lower()]
+        scrollbar = self.log_text.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 10
         
-        self.log_text.setPlainText('\n'.join(filtered))
-        self.line_count_label.setText(f"{len(filtered)} 行 (已过滤)")
+        self.log_text.appendPlainText(chunk)
+        
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+        
+        self._line_count = len(self._current_lines)
+        self.line_count_label.setText(f"{self._line_count} 行")
     
-    def _filter_by_level(self, level: str):
-        """按级别过滤"""
-        if level == "全部":
-            self._refresh_log()
-            return
+    def _set_text(self, text: str):
+        """整体替换日志文本
         
-        if not self.current_file:
+        替换期间暂停控件重绘，高亮器在 setPlainText 内同步完成着色，
+        恢复后只重绘一次。
+        """
+        self.log_text.setUpdatesEnabled(False)
+        try:
+            self.log_text.setPlainText(text)
+        finally:
+            self.log_text.setUpdatesEnabled(True)
+    
+    def _on_search(self, text: str):
+        """搜索输入变化（防抖）"""
+        self._search_timer.start()
+    
+    def _apply_filters(self):
+        """按搜索词和日志级别过滤已加载的日志行
+        
+        两个条件在同一次扫描中同时应用，修改任一条件都基于
+        内存中的日志行重新过滤，无需重新读取文件。
+        """
+        needle = self.search_edit.text().casefold()
+        level = self.level_combo.currentText()
+        token = None if level == "全部" else f"| {level}"
+        
+        if not needle and token is None:
+            # 取消过滤：直接显示已加载的全部行，增量读取偏移仍然有效
+            self._set_text('\n'.join(self._current_lines))
+            scrollbar = self.log_text.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
+            self._line_count = len(self._current_lines)
+            self.line_count_label.setText(f"{self._line_count} 行")
             return
         
-        lines = self.lines_spin.value()
-        content = self.log_manager.read_log(self.current_file, lines)
-        lines_list = content.split('\n')
-        filtered = [line for line in lines_list if f"| {level}" in line]
+        # 最多保留显示行数条匹配结果，超出时自动丢弃最早的匹配
+        filtered = deque(
+            (
+                line for line, lower in zip(self._current_lines, self._current_lines_lower)
+                if (not needle or needle in lower) and (token is None or token in line)
+            ),
+            maxlen=self.lines_spin.value()
+        )
         
-        self.log_text.setPlainText('\n'.join(filtered))
-        self.line_count_label.setText(f"{len(filtered)} 行 ({level})")
+        self._set_text('\n'.join(filtered))
+        self.line_count_label.setText(f"{len(filtered)} 行 (已过滤)")
     
     def _toggle_auto_refresh(self, checked: bool):
         """切换自动刷新"""
         self.auto_refresh = checked
         if checked:
-            self.refresh_timer.start(3000)  # 3秒刷新一次
-            self.status_label.setText("自动刷新已启用 (3秒)")
+            self._start_watching()
+            self.status_label.setText("自动刷新已启用 (监听文件变化)")
         else:
-            self.refresh_timer.stop()
+            self._stop_watching()
             self.status_label.setText("自动刷新已停止")
+    
+    def _watch_current_file(self) -> bool:
+        """监听当前日志文件，返回是否监听成功"""
+        watched = self._fs_watcher.files()
+        if watched:
+            self._fs_watcher.removePaths(watched)
+        if not self.current_file:
+            return False
+        path = self._log_path(self.current_file)
+        return os.path.exists(path) and self._fs_watcher.addPath(path)
+    
+    def _start_watching(self):
+        """开始监听当前文件，无法监听时回退为3秒轮询"""
+        if self._watch_current_file():
+            self.refresh_timer.stop()
+        else:
+            self.refresh_timer.start(3000)
+    
+    def _stop_watching(self):
+        """停止监听和轮询"""
+        watched = self._fs_watcher.files()
+        if watched:
+            self._fs_watcher.removePaths(watched)
+        self._watch_timer.stop()
+        self.refresh_timer.stop()
+    
+    def _on_file_modified(self, path: str):
+        """日志文件变化（防抖后刷新）"""
+        # 文件被轮转或删除后监听会自动失效，需要重新监听新文件
+        if path not in self._fs_watcher.files():
+            self._start_watching()
+        self._watch_timer.start()
+    
+    def _on_poll_timeout(self):
+        """回退轮询：文件重新出现后切回文件监听"""
+        if self._watch_current_file():
+            self.refresh_timer.stop()
+        self._refresh_log()
 
 
 class LogManagePanel(QFrame):
@@ -266,7 +624,10 @@ class LogManagePanel(QFrame):
         super().__init__(parent)
         self.setFixedWidth(300)
         
-        self.log_manager = LogManager()
+        self.log_manager = _LOG_MANAGER
+        self._export_worker = None
+        self._export_bar = None
+        self._export_progress = None
         self._init_ui()
         self._refresh_file_list()
     
@@ -309,7 +670,7 @@ class LogManagePanel(QFrame):
         btn_layout.addWidget(self.clear_btn)
         
         self.refresh_btn = PushButton(FluentIcon.SYNC, "刷新列表")
-        self.refresh_btn.clicked.connect(self._refresh_file_list)
+        self.refresh_btn.clicked.connect(lambda: self._refresh_file_list(force=True))
         btn_layout.addWidget(self.refresh_btn)
         
         layout.addLayout(btn_layout)
@@ -351,31 +712,33 @@ class LogManagePanel(QFrame):
         self.stats_label.setStyleSheet("color: gray; font-size: 11px;")
         layout.addWidget(self.stats_label)
     
-    def _refresh_file_list(self):
+    def _refresh_file_list(self, force: bool = False):
         """刷新文件列表"""
-        self.file_list.clear()
-        files = self.log_manager.get_log_files()
-        
-        total_size = 0
-        for f in files:
-            size_str = self._format_size(f["size"])
-            self.file_list.addItem(f"📄 {f['name']}\n   {size_str} | {f['modified']}")
-            total_size += f["size"]
-        
-        self.stats_label.setText(f"共 {len(files)} 个文件，总大小: {self._format_size(total_size)}")
-    
-    def _format_size(self, size: int) -> str:
-        """格式化文件大小"""
-        if size < 1024:
-            return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        else:
-            return f"{size / 1024 / 1024:.1f} MB"
+        files = _get_log_files(self.log_manager, force)
+        items = [
+            f"📄 {f['name']}\n   {_format_size(f['size'])} | {f['modified']}"
+            for f in files
+        ]
+        
+        # 一次性批量填充，避免逐项插入触发多次信号和重绘
+        self.file_list.setUpdatesEnabled(False)
+        self.file_list.blockSignals(True)
+        try:
+            self.file_list.clear()
+            self.file_list.addItems(items)
+        finally:
+            self.file_list.blockSignals(False)
+            self.file_list.setUpdatesEnabled(True)
+        
+        total_size = sum(f["size"] for f in files)
+        self.stats_label.setText(f"共 {len(files)} 个文件，总大小: {_format_size(total_size)}")
     
     def _export_log(self):
         """导出日志"""
-        files = self.log_manager.get_log_files()
+        from PySide6.QtWidgets import QFileDialog
+        from qfluentwidgets import InfoBar, InfoBarPosition, ProgressBar
+        
+        files = _get_log_files(self.log_manager)
         if not files:
             InfoBar.warning(
                 title="无日志文件",
@@ -393,35 +756,70 @@ class LogManagePanel(QFrame):
         if not save_path:
             return
         
-        try:
-            # 合并所有日志
-            content = []
-            for f in files:
-                content.append(f"{'='*60}")
-                content.append(f"文件: {f['name']}")
-                content.append(f"{'='*60}")
-                content.append(self.log_manager.read_log(f['name'], 10000))
-                content.append("\n")
-            
-            with open(save_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(content))
-            
-            InfoBar.success(
-                title="导出成功",
-                content=f"日志已导出到: {save_path}",
-                parent=self,
-                position=InfoBarPosition.TOP
-            )
-        except Exception as e:
-            InfoBar.error(
-                title="导出失败",
-                content=str(e),
-                parent=self,
-                position=InfoBarPosition.TOP
-            )
+        # 导出在后台线程执行，进度显示在提示条中
+        self._export_progress = ProgressBar()
+        self._export_progress.setRange(0, len(files))
+        self._export_progress.setValue(0)
+        self._export_bar = InfoBar.info(
+            title="正在导出",
+            content="正在导出日志...",
+            isClosable=False,
+            duration=-1,
+            parent=self,
+            position=InfoBarPosition.TOP
+        )
+        self._export_bar.addWidget(self._export_progress)
+        self.export_btn.setEnabled(False)
+        
+        worker = _ExportWorker(files, save_path)
+        worker.progress.connect(self._on_export_progress)
+        worker.finished.connect(self._on_export_finished)
+        worker.failed.connect(self._on_export_failed)
+        self._export_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_export_progress(self, done: int, total: int):
+        """导出进度更新"""
+        if self._export_progress:
+            self._export_progress.setValue(done)
+    
+    def _end_export(self):
+        """导出结束，清理进度提示"""
+        if self._export_bar:
+            self._export_bar.close()
+        self._export_bar = None
+        self._export_progress = None
+        self._export_worker = None
+        self.export_btn.setEnabled(True)
+    
+    def _on_export_finished(self, save_path: str):
+        """导出完成"""
+        from qfluentwidgets import InfoBar, InfoBarPosition
+        
+        self._end_export()
+        InfoBar.success(
+            title="导出成功",
+            content=f"日志已导出到: {save_path}",
+            parent=self,
+            position=InfoBarPosition.TOP
+        )
+    
+    def _on_export_failed(self, error: str):
+        """导出失败"""
+        from qfluentwidgets import InfoBar, InfoBarPosition
+        
+        self._end_export()
+        InfoBar.error(
+            title="导出失败",
+            content=error,
+            parent=self,
+            position=InfoBarPosition.TOP
+        )
     
     def _clear_old_logs(self):
         """清理旧日志"""
+        from qfluentwidgets import MessageBox, InfoBar, InfoBarPosition
+        
         box = MessageBox(
             "清理旧日志",
             "确定要清理7天前的日志文件吗？\n此操作不可恢复。",
@@ -441,6 +839,8 @@ class LogManagePanel(QFrame):
     
     def _on_console_level_changed(self, level: str):
         """控制台日志级别变化"""
+        from qfluentwidgets import InfoBar, InfoBarPosition
+        
         self.log_manager.set_level(level, "console")
         InfoBar.info(
             title="设置已更新",
@@ -452,6 +852,8 @@ class LogManagePanel(QFrame):
     
     def _on_file_level_changed(self, level: str):
         """文件日志级别变化"""
+        from qfluentwidgets import InfoBar, InfoBarPosition
+        
         self.log_manager.set_level(level, "file")
         InfoBar.info(
             title="设置已更新",
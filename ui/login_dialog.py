@@ -5,42 +5,104 @@
 
 import os
 import json
-import base64
-import secrets
+import threading
+import binascii
+import hashlib
+import hmac
 import time
 import logging
+from collections import OrderedDict, deque
+from datetime import datetime
 
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QWidget, QStackedWidget
+    QDialog, QVBoxLayout, QHBoxLayout, QWidget
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool
 
 from qfluentwidgets import (
     LineEdit, PasswordLineEdit, PrimaryPushButton, PushButton,
-    TitleLabel, SubtitleLabel, BodyLabel, CardWidget,
-    InfoBar, InfoBarPosition, FluentIcon
+    TitleLabel, SubtitleLabel, BodyLabel,
+    InfoBar, InfoBarPosition
 )
 
-# 导入密码哈希库
-try:
-    from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-    from cryptography.hazmat.backends import default_backend
-    CRYPTO_AVAILABLE = True
-except ImportError as e:
-    CRYPTO_AVAILABLE = False
-    logging.warning(f"cryptography库导入失败: {e}")
-
 logger = logging.getLogger(__name__)
 
+# 可选：orjson（C实现的JSON编解码），未安装时使用标准库 json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(data) -> bytes:
+    """序列化为UTF-8编码的JSON（缩进2，保留中文）"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _json_loads(raw: bytes):
+    """解析JSON字节数据"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# 密码记录算法标识 -> (hashlib 摘要算法, 派生长度)
+# 新密码使用 SHA-512（64位平台上每轮 HMAC 更快），SHA-256 记录仍可验证
+_PBKDF2_ALGOS = {
+    "pbkdf2_sha512": ("sha512", 64),
+    "pbkdf2_sha256": ("sha256", 32),
+}
+_DEFAULT_PBKDF2_ALGO = "pbkdf2_sha512"
+
+# 密码验证成功结果的缓存有效期（秒）和最大条目数
+_VERIFY_CACHE_TTL = 60
+_VERIFY_CACHE_SIZE = 32
+
+# 常见弱密码（小写比较）
+_WEAK_PWDS = frozenset({
+    "admin123",
+    "123456",
+    "password",
+    "qwerty",
+    "000000",
+    "111111",
+    "abcdefg",
+})
+
+
+def _env_iterations(default: int = 150_000) -> int:
+    """读取 PBKDF2_ITERS 环境变量作为PBKDF2迭代次数"""
+    try:
+        return max(1, int(os.environ.get("PBKDF2_ITERS", default)))
+    except ValueError:
+        logger.warning("PBKDF2_ITERS 不是有效整数，使用默认值 %d", default)
+        return default
+
 
 class AuthManager:
     """用户认证管理器"""
     
+    # 新密码记录使用的PBKDF2迭代次数（可通过 PBKDF2_ITERS 环境变量调整）
+    _TARGET_ITERS = _env_iterations()
+    
     def __init__(self):
         self._users_file = self._get_users_file()
         self._failed_attempts = {}
         self._lock_until = {}
+        # 最近验证成功的密码：(记录哈希, HMAC(盐, 密码)) -> 验证时间
+        # 只缓存成功结果，失败始终走完整的PBKDF2计算和失败计数
+        self._verify_cache = OrderedDict()
+        # 认证操作在线程池中并发执行，访问验证缓存时加锁（不在锁内计算PBKDF2）
+        self._verify_lock = threading.Lock()
+        
+        self._pending_file = os.path.join(os.path.dirname(self._users_file), "pending_registrations.json")
+        # 已读取的文件内容：文件路径 -> ((st_mtime_ns, st_size), 内容)，文件未变化时不再重复解析
+        self._read_cache = {}
+        # 认证操作在线程池中执行，读写文件和缓存时加锁
+        self._io_lock = threading.Lock()
+        
         self._ensure_default_admin()
     
     def _get_users_file(self):
@@ -61,86 +123,85 @@ class AuthManager:
                     "must_change_password": True
                 }
             }
-            with open(self._users_file, 'w', encoding='utf-8') as f:
-                json.dump(default_users, f, ensure_ascii=False, indent=2)
+            self._write_json_file(self._users_file, default_users)
 
-    def _make_password_record(self, password: str, iterations: int = 150_000) -> dict:
+    def _make_password_record(self, password: str, iterations: int = None) -> dict:
         """使用PBKDF2创建密码记录"""
-        if not CRYPTO_AVAILABLE:
-            raise RuntimeError("cryptography库未安装或导入失败，无法创建安全密码。请运行: pip install cryptography")
-        
+        if iterations is None:
+            iterations = self._TARGET_ITERS
         try:
-            salt = secrets.token_bytes(16)
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=int(iterations),
+            hash_name, length = _PBKDF2_ALGOS[_DEFAULT_PBKDF2_ALGO]
+            salt = os.urandom(16)
+            digest = hashlib.pbkdf2_hmac(
+                hash_name, password.encode("utf-8"), salt, int(iterations), dklen=length
             )
-            digest = kdf.derive(password.encode("utf-8"))
             
             return {
-                "algo": "pbkdf2_sha256",
-                "salt": base64.b64encode(salt).decode("ascii"),
+                "algo": _DEFAULT_PBKDF2_ALGO,
+                "salt": binascii.b2a_base64(salt, newline=False).decode("ascii"),
                 "iterations": int(iterations),
-                "hash": base64.b64encode(digest).decode("ascii"),
+                "hash": binascii.b2a_base64(digest, newline=False).decode("ascii"),
             }
         except Exception as e:
             raise RuntimeError(f"密码加密失败: {e}")
 
     def _verify_password_record(self, password: str, record: dict) -> bool:
         """验证PBKDF2密码"""
-        if not CRYPTO_AVAILABLE:
-            return False
-        
         if not isinstance(record, dict):
             return False
-        algo = record.get("algo")
-        if algo != "pbkdf2_sha256":
+        get = record.get
+        algo = _PBKDF2_ALGOS.get(get("algo"))
+        if algo is None:
             return False
+        hash_name, length = algo
 
+        # 存储的哈希保持base64形式，与新计算结果的base64直接比较，省去一次解码
         try:
-            salt = base64.b64decode(record.get("salt", ""), validate=True)
-            expected = base64.b64decode(record.get("hash", ""), validate=True)
-            iterations = int(record.get("iterations", 0))
+            salt = binascii.a2b_base64(get("salt", ""))
+            expected = get("hash", "").encode("ascii")
+            iterations = int(get("iterations", 0))
         except Exception:
             return False
 
         if not salt or not expected or iterations <= 0:
             return False
 
+        pwd_bytes = password.encode("utf-8")
+        cache_key = (expected, hmac.new(salt, pwd_bytes, "sha256").digest())
+        now = time.monotonic()
+        with self._verify_lock:
+            verified_at = self._verify_cache.get(cache_key)
+            if verified_at is not None:
+                if now - verified_at <= _VERIFY_CACHE_TTL:
+                    self._verify_cache.move_to_end(cache_key)
+                    return True
+                self._verify_cache.pop(cache_key, None)
+
         try:
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=iterations,
+            got = hashlib.pbkdf2_hmac(
+                hash_name, pwd_bytes, salt, iterations, dklen=length
             )
-            got = kdf.derive(password.encode("utf-8"))
-            return secrets.compare_digest(got, expected)
+            ok = hmac.compare_digest(binascii.b2a_base64(got, newline=False), expected)
         except Exception:
             return False
 
+        if ok:
+            with self._verify_lock:
+                self._verify_cache[cache_key] = now
+                while len(self._verify_cache) > _VERIFY_CACHE_SIZE:
+                    self._verify_cache.popitem(last=False)
+        return ok
+
     def _is_weak_password(self, username: str, password: str) -> bool:
         pwd = (password or "").strip()
         if len(pwd) < 8:
             return True
-        if username and pwd.lower() == username.lower():
-            return True
-        weak_list = {
-            "admin123",
-            "123456",
-            "password",
-            "qwerty",
-            "000000",
-            "111111",
-            "abcdefg",
-        }
-        if pwd.lower() in weak_list:
-            return True
-        if pwd.isdigit() and len(pwd) <= 10:
-            return True
-        return False
+        pwd_lower = pwd.lower()
+        return (
+            pwd_lower in _WEAK_PWDS
+            or (bool(username) and pwd_lower == username.lower())
+            or (len(pwd) <= 10 and pwd.isdigit())
+        )
 
     def _is_locked(self, username: str) -> tuple:
         until = self._lock_until.get(username)
@@ -153,10 +214,13 @@ class AuthManager:
 
     def _mark_failed(self, username: str):
         now = time.time()
-        items = self._failed_attempts.get(username, [])
-        items = [t for t in items if now - t <= 300]
+        # 每个用户保留最近的失败时间，过期记录从队首弹出
+        items = self._failed_attempts.get(username)
+        if items is None:
+            items = self._failed_attempts[username] = deque(maxlen=32)
+        while items and now - items[0] > 300:
+            items.popleft()
         items.append(now)
-        self._failed_attempts[username] = items
         if len(items) >= 5:
             self._lock_until[username] = now + 300
 
@@ -164,19 +228,80 @@ class AuthManager:
         self._failed_attempts.pop(username, None)
         self._lock_until.pop(username, None)
     
-    def _load_users(self) -> dict:
-        """加载用户数据"""
+    @staticmethod
+    def _file_key(path: str) -> tuple:
+        """文件版本标识：修改时间和大小，同一时间精度内的外部写入也能识别"""
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    
+    def _read_json(self, path: str) -> dict:
+        """读取JSON数据
+        
+        返回的是缓存中的共享对象，调用方只能读取；
+        需要修改时先复制要改动的部分，再交给 _save_json 写入。
+        """
+        try:
+            key = self._file_key(path)
+        except OSError:
+            return {}
+        with self._io_lock:
+            cached = self._read_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
         try:
-            with open(self._users_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(path, 'rb') as f:
+                data = _json_loads(f.read())
         except:
             return {}
+        with self._io_lock:
+            self._read_cache[path] = (key, data)
+        return data
+    
+    def _write_json_file(self, path: str, data: dict):
+        """写入JSON文件
+        
+        先写入临时文件并 fsync 落盘，再原子替换目标文件，
+        写入中断（断电、进程被杀）时原文件保持完整。
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, 'wb') as f:
+            f.write(_json_dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    
+    def _save_json(self, path: str, data: dict):
+        """立即写入JSON数据
+        
+        users.json 还会被用户管理页面和权限管理器直接写入，
+        因此不做延迟写盘，避免延迟的写入覆盖其间其它模块的修改。
+        """
+        with self._io_lock:
+            try:
+                self._write_json_file(path, data)
+                # 调用方交给写入的是自己的副本，写入后不再修改，可直接缓存
+                self._read_cache[path] = (self._file_key(path), data)
+            except Exception:
+                # 写入失败时缓存可能与磁盘不一致，下次读取重新解析文件
+                self._read_cache.pop(path, None)
+                raise
+    
+    def _load_users(self) -> dict:
+        """加载用户数据"""
+        return self._read_json(self._users_file)
     
     def _save_users(self, users: dict):
         """保存用户数据"""
-        os.makedirs(os.path.dirname(self._users_file), exist_ok=True)
-        with open(self._users_file, 'w', encoding='utf-8') as f:
-            json.dump(users, f, ensure_ascii=False, indent=2)
+        self._save_json(self._users_file, users)
+    
+    def _load_pending(self) -> dict:
+        """加载待审核注册申请"""
+        return self._read_json(self._pending_file)
+    
+    def _save_pending(self, pending: dict):
+        """保存待审核注册申请"""
+        self._save_json(self._pending_file, pending)
     
     def login(self, username: str, password: str) -> tuple:
         """登录验证
@@ -210,6 +335,7 @@ class AuthManager:
             return False, "密码错误", False, ""
 
         self._clear_failed(username)
+        self._upgrade_record_if_needed(users, username, password)
 
         require_change = bool(user.get("must_change_password")) or self._is_weak_password(username, password)
         if username == "admin" and password == "admin123":
@@ -218,6 +344,30 @@ class AuthManager:
         role = user.get("role", "cs")  # 默认为客服角色
         return True, user.get("name", username), require_change, role
     
+    def _upgrade_record_if_needed(self, users: dict, username: str, password: str):
+        """登录成功后按需升级密码记录
+        
+        记录的算法不是当前默认算法，或迭代次数明显低于目标值时，
+        用刚验证过的明文密码重新生成记录，逐步完成迁移而无需批量重置。
+        """
+        record = users[username]["password"]
+        try:
+            iterations = int(record.get("iterations", 0))
+        except (TypeError, ValueError):
+            return
+        if record.get("algo") == _DEFAULT_PBKDF2_ALGO and iterations >= self._TARGET_ITERS * 0.9:
+            return
+        try:
+            new_record = self._make_password_record(password)
+        except RuntimeError as e:
+            logger.warning(f"升级用户 {username} 的密码记录失败: {e}")
+            return
+        # 读取到的是共享的缓存对象，复制后再修改
+        users = dict(users)
+        users[username] = {**users[username], "password": new_record}
+        self._save_users(users)
+        logger.info(f"已升级用户 {username} 的密码记录")
+    
     def register(self, username: str, password: str, confirm_password: str, role: str = "cs") -> tuple:
         """提交注册申请
         Returns: (success: bool, message: str)
@@ -239,18 +389,13 @@ class AuthManager:
             return False, "用户名已存在"
         
         # 检查是否已有待审核申请
-        pending_file = os.path.join(os.path.dirname(self._users_file), "pending_registrations.json")
-        try:
-            with open(pending_file, 'r', encoding='utf-8') as f:
-                pending = json.load(f)
-        except:
-            pending = {}
+        pending = self._load_pending()
         
         if username in pending:
             return False, "该用户名已有待审核的注册申请"
         
-        # 添加到待审核列表
-        from datetime import datetime
+        # 添加到待审核列表（复制后修改，不改动缓存对象）
+        pending = dict(pending)
         pending[username] = {
             "password": self._make_password_record(password),
             "role": role,
@@ -258,8 +403,7 @@ class AuthManager:
             "apply_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
-        with open(pending_file, 'w', encoding='utf-8') as f:
-            json.dump(pending, f, ensure_ascii=False, indent=2)
+        self._save_pending(pending)
         
         return True, "注册申请已提交，请等待管理员审核"
 
@@ -277,7 +421,8 @@ class AuthManager:
         if username not in users:
             return False, "用户不存在"
 
-        user = users.get(username, {})
+        # 读取到的是共享的缓存对象，复制后再修改
+        user = dict(users.get(username, {}))
 
         # 只验证PBKDF2格式
         record = user.get("password")
@@ -290,18 +435,55 @@ class AuthManager:
             return False, "原密码不正确"
 
         user["password"] = self._make_password_record(new_password)
+        with self._verify_lock:
+            self._verify_cache.clear()
         user.pop("password_hash", None)  # 清理可能残留的旧字段
         user["must_change_password"] = False
+        users = dict(users)
         users[username] = user
         self._save_users(users)
         return True, "密码修改成功"
 
 
+class _AuthWorker(QObject, QRunnable):
+    """在线程池中执行认证操作（PBKDF2计算较慢，避免阻塞界面）"""
+    
+    finished = Signal(object)
+    
+    def __init__(self, func, args: tuple, fail_extra: tuple = ()):
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+        # 由对话框持有引用，不交给线程池自动删除
+        self.setAutoDelete(False)
+        self._func = func
+        self._args = args
+        # 出错时附加在 (False, 错误信息) 之后的字段，使结果与正常返回值结构一致
+        self._fail_extra = fail_extra
+    
+    def run(self):
+        # 无论成功与否都要发出 finished，否则对话框会一直停留在处理中状态
+        try:
+            result = self._func(*self._args)
+        except Exception as e:
+            logger.exception("认证操作失败")
+            result = (False, f"操作失败: {e}") + self._fail_extra
+        self.finished.emit(result)
+
+
+def _start_auth_worker(func, args: tuple, callback, fail_extra: tuple = ()) -> _AuthWorker:
+    """提交认证任务到全局线程池，结果通过信号回到界面线程"""
+    worker = _AuthWorker(func, args, fail_extra)
+    worker.finished.connect(callback)
+    QThreadPool.globalInstance().start(worker)
+    return worker
+
+
 class ChangePasswordDialog(QDialog):
     def __init__(self, username: str, auth: AuthManager, parent=None):
         super().__init__(parent)
         self._username = username
         self._auth = auth
+        self._worker = None
 
         self.setWindowTitle("修改密码")
         self.setFixedSize(420, 320)
@@ -346,12 +528,20 @@ class ChangePasswordDialog(QDialog):
         layout.addLayout(btn_row)
 
     def _submit(self):
-        ok, msg = self._auth.change_password(
-            self._username,
-            self.old_pwd.text(),
-            self.new_pwd.text(),
-            self.new_pwd2.text(),
+        """提交修改（密码验证在线程池中执行）"""
+        if self._worker is not None:
+            return
+        self.submit_btn.setEnabled(False)
+        self._worker = _start_auth_worker(
+            self._auth.change_password,
+            (self._username, self.old_pwd.text(), self.new_pwd.text(), self.new_pwd2.text()),
+            self._on_submit_result,
         )
+    
+    def _on_submit_result(self, result: tuple):
+        self._worker = None
+        self.submit_btn.setEnabled(True)
+        ok, msg = result
         if ok:
             InfoBar.success(
                 title="修改成功",
@@ -379,6 +569,8 @@ class LoginDialog(QDialog):
         super().__init__(parent)
         self.auth = AuthManager()
         self._login_in_progress = False
+        self._login_username = ""
+        self._worker = None
         self.setWindowTitle("管理后台登录")
         self.setFixedSize(400, 480)
         # 保留关闭按钮，移除帮助按钮
@@ -405,18 +597,21 @@ class LoginDialog(QDialog):
         
         layout.addSpacing(10)
         
-        # 登录/注册切换
-        self.stack = QStackedWidget()
+        # 登录/注册切换（两个页面放在同一容器中，通过显示/隐藏切换）
+        pages = QWidget()
+        pages_layout = QVBoxLayout(pages)
+        pages_layout.setContentsMargins(0, 0, 0, 0)
         
         # 登录页面
         self.login_page = self._create_login_page()
-        self.stack.addWidget(self.login_page)
+        pages_layout.addWidget(self.login_page)
         
         # 注册页面
         self.register_page = self._create_register_page()
-        self.stack.addWidget(self.register_page)
+        self.register_page.setVisible(False)
+        pages_layout.addWidget(self.register_page)
         
-        layout.addWidget(self.stack)
+        layout.addWidget(pages)
         layout.addStretch()
         
         # 默认提示
@@ -425,6 +620,11 @@ class LoginDialog(QDialog):
         hint.setStyleSheet("color: #999; font-size: 11px;")
         layout.addWidget(hint)
     
+    def _show_page(self, index: int):
+        """切换页面：0 登录，1 注册"""
+        self.login_page.setVisible(index == 0)
+        self.register_page.setVisible(index == 1)
+    
     def _create_login_page(self):
         page = QWidget()
         layout = QVBoxLayout(page)
@@ -456,7 +656,7 @@ class LoginDialog(QDialog):
         switch_label = BodyLabel("没有账号？")
         switch_layout.addWidget(switch_label)
         switch_btn = PushButton("立即注册")
-        switch_btn.clicked.connect(lambda: self.stack.setCurrentIndex(1))
+        switch_btn.clicked.connect(lambda: self._show_page(1))
         switch_layout.addWidget(switch_btn)
         switch_layout.addStretch()
         layout.addLayout(switch_layout)
@@ -511,7 +711,7 @@ class LoginDialog(QDialog):
         switch_layout.addWidget(switch_label)
         switch_btn = PushButton("返回登录")
         switch_btn.setFixedSize(90,32)
-        switch_btn.clicked.connect(lambda: self.stack.setCurrentIndex(0))
+        switch_btn.clicked.connect(lambda: self._show_page(0))
         switch_layout.addWidget(switch_btn)
         switch_layout.addStretch()
         layout.addLayout(switch_layout)
@@ -520,15 +720,25 @@ class LoginDialog(QDialog):
     
     def _do_login(self):
         """执行登录"""
-        if self._login_in_progress:
+        if self._login_in_progress or self._worker is not None:
             return
         self._login_in_progress = True
+        self.login_btn.setEnabled(False)
 
         username = self.login_username.text().strip()
         password = self.login_password.text()
-
+        self._login_username = username
+        self._worker = _start_auth_worker(
+            self.auth.login, (username, password), self._on_login_result,
+            fail_extra=(False, ""),
+        )
+    
+    def _on_login_result(self, result: tuple):
+        """登录验证完成（界面线程）"""
+        self._worker = None
+        username = self._login_username
         try:
-            success, message, require_change, role = self.auth.login(username, password)
+            success, message, require_change, role = result
             
             if success:
                 # 设置权限管理器的当前用户
@@ -560,16 +770,30 @@ class LoginDialog(QDialog):
                 )
         finally:
             self._login_in_progress = False
+            self.login_btn.setEnabled(True)
     
     def _do_register(self):
         """执行注册"""
+        if self._worker is not None:
+            return
         username = self.reg_username.text().strip()
         password = self.reg_password.text()
         confirm = self.reg_confirm.text()
         role_text = self.reg_role.currentText()
         role = "admin" if role_text == "管理员" else "cs"
         
-        success, message = self.auth.register(username, password, confirm, role)
+        self.reg_btn.setEnabled(False)
+        self._worker = _start_auth_worker(
+            self.auth.register,
+            (username, password, confirm, role),
+            self._on_register_result,
+        )
+    
+    def _on_register_result(self, result: tuple):
+        """注册申请提交完成（界面线程）"""
+        self._worker = None
+        self.reg_btn.setEnabled(True)
+        success, message = result
         
         if success:
             InfoBar.success(
@@ -584,7 +808,7 @@ class LoginDialog(QDialog):
             self.reg_password.clear()
             self.reg_confirm.clear()
             self.reg_role.setCurrentIndex(0)
-            self.stack.setCurrentIndex(0)
+            self._show_page(0)
         else:
             InfoBar.error(
                 title="提交失败",
@@ -5,7 +5,7 @@
 
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QStackedWidget
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon
+from PySide6.QtGui import QIcon, QGuiApplication
 
 from qfluentwidgets import (
     FluentWindow, NavigationItemPosition, FluentIcon,
@@ -25,9 +25,39 @@ from core.config import Config
 from core.permissions import get_permission_manager
 
 
+class _LazyInterface(QWidget):
+    """延迟创建的子界面占位
+    
+    注册到导航栏时只创建一个空容器，第一次切换到该页面时
+    才构造真正的界面，未访问的页面不占用启动时间。
+    """
+    
+    def __init__(self, factory, object_name: str, parent=None):
+        super().__init__(parent)
+        self.setObjectName(object_name)
+        self._factory = factory
+        self.widget = None
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+    
+    def ensure_created(self):
+        """构造真正的界面（只构造一次）"""
+        if self.widget is None:
+            self.widget = self._factory(self)
+            self._layout.addWidget(self.widget)
+        return self.widget
+    
+    def showEvent(self, event):
+        self.ensure_created()
+        super().showEvent(event)
+
+
 class MainWindow(FluentWindow):
     """主窗口类 - 使用Fluent导航窗口"""
     
+    # 主屏幕几何信息（首次居中时获取，重新登录创建窗口时复用）
+    _screen_geom = None
+    
     def __init__(self, username: str = "", role: str = "cs"):
         super().__init__()
         self.config = Config()
@@ -52,14 +82,18 @@ class MainWindow(FluentWindow):
     
     def _center_window(self):
         """窗口居中显示"""
-        from PySide6.QtGui import QGuiApplication
-        screen = QGuiApplication.primaryScreen().geometry()
+        if MainWindow._screen_geom is None:
+            MainWindow._screen_geom = QGuiApplication.primaryScreen().geometry()
+        screen = MainWindow._screen_geom
         x = (screen.width() - self.width()) // 2
         y = (screen.height() - self.height()) // 2
         self.move(x, y)
     
     def _init_navigation(self):
-        """初始化导航栏 - 根据用户角色显示不同页面"""
+        """初始化导航栏 - 根据用户角色显示不同页面
+        
+        首页（工作台）立即创建，其余页面首次切换时才创建。
+        """
         # 获取用户可见的页面列表
         visible_pages = self.permission_manager.get_visible_pages()
         
@@ -74,7 +108,7 @@ class MainWindow(FluentWindow):
         
         # 人工客服界面 - 所有角色可见
         if "human_service" in visible_pages:
-            self.human_service_interface = HumanServiceInterface(self)
+            self.human_service_interface = _LazyInterface(HumanServiceInterface, "human_service_interface", self)
             self.addSubInterface(
                 self.human_service_interface,
                 FluentIcon.HEADPHONE,
@@ -83,7 +117,7 @@ class MainWindow(FluentWindow):
         
         # 知识库管理界面 - 仅管理员可见
         if "knowledge" in visible_pages:
-            self.knowledge_interface = KnowledgeInterface(self)
+            self.knowledge_interface = _LazyInterface(KnowledgeInterface, "knowledge_interface", self)
             self.addSubInterface(
                 self.knowledge_interface,
                 FluentIcon.BOOK_SHELF,
@@ -92,7 +126,7 @@ class MainWindow(FluentWindow):
         
         # 商品管理界面 - 管理员和客服可见
         if "product" in visible_pages:
-            self.product_interface = ProductInterface(self)
+            self.product_interface = _LazyInterface(ProductInterface, "product_interface", self)
             self.addSubInterface(
                 self.product_interface,
                 FluentIcon.SHOPPING_CART,
@@ -101,7 +135,7 @@ class MainWindow(FluentWindow):
         
         # 数据统计界面 - 仅管理员可见
         if "statistics" in visible_pages:
-            self.statistics_interface = StatisticsInterface(self)
+            self.statistics_interface = _LazyInterface(StatisticsInterface, "statistics_interface", self)
             self.addSubInterface(
                 self.statistics_interface,
                 FluentIcon.IOT,
@@ -110,7 +144,7 @@ class MainWindow(FluentWindow):
         
         # 性能监控界面 - 仅管理员可见
         if "performance" in visible_pages:
-            self.performance_interface = PerformanceInterface(self)
+            self.performance_interface = _LazyInterface(PerformanceInterface, "performance_interface", self)
             self.addSubInterface(
                 self.performance_interface,
                 FluentIcon.SPEED_HIGH,
@@ -119,7 +153,7 @@ class MainWindow(FluentWindow):
         
         # 日志管理界面 - 仅管理员可见
         if "log" in visible_pages:
-            self.log_interface = LogInterface(self)
+            self.log_interface = _LazyInterface(LogInterface, "log_interface", self)
             self.addSubInterface(
                 self.log_interface,
                 FluentIcon.DOCUMENT,
@@ -128,7 +162,7 @@ class MainWindow(FluentWindow):
         
         # 用户管理界面 - 仅管理员可见
         if "user" in visible_pages:
-            self.user_interface = UserInterface(self)
+            self.user_interface = _LazyInterface(UserInterface, "userInterface", self)
             self.addSubInterface(
                 self.user_interface,
                 FluentIcon.PEOPLE,
@@ -4,22 +4,161 @@
 提供性能指标查看、图表展示、报告导出等功能
 """
 
+import time
+import logging
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFrame,
     QGridLayout, QFileDialog, QHeaderView, QApplication
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import (
+    Qt, QTimer, Signal, QObject, QRunnable, QThreadPool,
+    QAbstractTableModel, QModelIndex
+)
 from PySide6.QtGui import QFont
 
 from qfluentwidgets import (
     CardWidget, BodyLabel, TitleLabel, SubtitleLabel,
     PushButton, PrimaryPushButton, ComboBox, 
-    TableWidget, FluentIcon, InfoBar, InfoBarPosition,
-    SwitchButton, ProgressBar
+    TableView, FluentIcon, InfoBar, InfoBarPosition,
+    SwitchButton, ProgressBar, MessageBox
 )
 
 from core.performance import PerformanceMonitor
 
+logger = logging.getLogger(__name__)
+
+# 指标名称映射
+_NAME_MAP = {
+    "chat_api": "💬 Chat API",
+    "embedding_api": "🔢 Embedding API",
+    "vector_search": "🔍 向量检索",
+    "keyword_search": "📝 关键词搜索",
+    "knowledge_add": "➕ 知识库添加",
+    "knowledge_update": "✏️ 知识库更新",
+}
+_NAME_MAP_GET = _NAME_MAP.get
+
+# 表格中的耗时列（按列顺序）及其格式化函数（秒 -> "x.xms"）
+_DURATION_KEYS = ("avg_duration", "min_duration", "max_duration", "p50_duration", "p95_duration")
+_format_ms = "%.1fms".__mod__
+
+# 连续提示条的合并间隔（秒）
+_INFO_BAR_INTERVAL = 0.3
+
+# 导出报告时的写缓冲大小
+_EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# 指标卡片标签样式（直接设置在标签上：Fluent 标签自带样式表，
+# 父控件样式表中的规则会被其覆盖，不会生效）
+_METRIC_TITLE_QSS = "color: gray; font-size: 12px;"
+_METRIC_VALUE_QSS = "font-size: 28px; font-weight: bold;"
+_METRIC_DESC_QSS = "color: gray; font-size: 11px;"
+
+
+class _StatsWorker(QObject, QRunnable):
+    """性能统计任务（在线程池中计算，避免阻塞界面）"""
+    
+    finished = Signal(object)
+    
+    def __init__(self, monitor: PerformanceMonitor, last_n, include_summary: bool = True):
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+        # 由界面持有引用，不交给线程池自动删除
+        self.setAutoDelete(False)
+        self._monitor = monitor
+        self._last_n = last_n
+        self._include_summary = include_summary
+    
+    def run(self):
+        # 出错时发出 None，保证界面总能收到结果并解除“统计中”状态
+        try:
+            snapshot = self._monitor.get_dashboard_snapshot(self._last_n, self._include_summary)
+        except Exception:
+            logger.exception("计算性能统计失败")
+            snapshot = None
+        self.finished.emit(snapshot)
+
+
+class _ExportWorker(QObject, QRunnable):
+    """报告导出任务（在线程池中写文件，避免阻塞界面）"""
+    
+    finished = Signal(bool, str)
+    
+    def __init__(self, save_path: str, iter_chunks):
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+        self.setAutoDelete(False)
+        self._save_path = save_path
+        self._iter_chunks = iter_chunks
+    
+    def run(self):
+        try:
+            with open(self._save_path, 'w', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as f:
+                for chunk in self._iter_chunks():
+                    f.write(chunk)
+        except Exception as e:
+            self.finished.emit(False, str(e))
+            return
+        self.finished.emit(True, self._save_path)
+
+
+class _MetricsTableModel(QAbstractTableModel):
+    """指标详情表格模型
+    
+    每行保存已格式化好的 8 列文本，视图只对可见单元格调用 data()。
+    """
+    
+    HEADERS = [
+        "指标名称", "请求数", "成功率", "平均耗时",
+        "最小耗时", "最大耗时", "P50", "P95"
+    ]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[tuple] = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def set_rows(self, rows: list):
+        """更新表格数据
+        
+        行集合（指标名称列）变化时重置模型，否则把有变化的行合并为一次 dataChanged 通知。
+        """
+        old_rows = self._rows
+        if len(rows) != len(old_rows) or any(a[0] != b[0] for a, b in zip(rows, old_rows)):
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+            return
+        
+        changed = [row for row, (new, old) in enumerate(zip(rows, old_rows)) if new != old]
+        self._rows = rows
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], 0),
+                self.index(changed[-1], len(self.HEADERS) - 1),
+                [Qt.DisplayRole]
+            )
+
 
 class MetricCard(CardWidget):
     """单个指标卡片"""
@@ -34,17 +173,17 @@ class MetricCard(CardWidget):
         
         # 标题
         self.title_label = BodyLabel(title)
-        self.title_label.setStyleSheet("color: gray; font-size: 12px;")
+        self.title_label.setStyleSheet(_METRIC_TITLE_QSS)
         layout.addWidget(self.title_label)
         
         # 主要数值
         self.value_label = TitleLabel("--")
-        self.value_label.setStyleSheet("font-size: 28px; font-weight: bold;")
+        self.value_label.setStyleSheet(_METRIC_VALUE_QSS)
         layout.addWidget(self.value_label)
         
         # 副标题/描述
         self.desc_label = BodyLabel("")
-        self.desc_label.setStyleSheet("color: gray; font-size: 11px;")
+        self.desc_label.setStyleSheet(_METRIC_DESC_QSS)
         layout.addWidget(self.desc_label)
         
         layout.addStretch()
@@ -65,10 +204,38 @@ class PerformanceInterface(QWidget):
         self.monitor = PerformanceMonitor()
         self.auto_refresh = False
         self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self._refresh_data)
+        # 5秒级的定时刷新不需要精确唤醒，允许与其他事件合并
+        self.refresh_timer.setTimerType(Qt.VeryCoarseTimer)
+        self.refresh_timer.timeout.connect(self._refresh_data, Qt.QueuedConnection)
+        
+        # 统计范围切换防抖
+        self._range_timer = QTimer(self)
+        self._range_timer.setSingleShot(True)
+        self._range_timer.setInterval(150)
+        self._range_timer.timeout.connect(self._refresh_data)
+        
+        # 首次显示时才加载数据
+        self._loaded = False
+        # 界面不可见时跳过刷新，重新显示时补一次
+        self._refresh_pending = False
+        
+        # 后台统计任务；计算期间再次请求刷新时，完成后补一次
+        # 任务对象保留到下次刷新，避免 run() 尚未返回时被回收
+        self._stats_worker = None
+        self._stats_running = False
+        self._refresh_queued = False
+        self._export_worker = None
+        
+        # 最近一次显示的提示条及其时间，用于合并连续提示
+        self._info_bar = None
+        self._last_info_bar_ts = 0.0
+        
+        # 上次统计时的（数据版本号, 统计范围），未变化时跳过重新统计
+        self._last_stats_key = None
+        # 摘要与统计范围无关：(数据版本号, 摘要)，仅切换范围时复用
+        self._summary_cache = None
         
         self._init_ui()
-        self._refresh_data()
     
     def _ensure_valid_font_point_size(self, widget: QWidget) -> None:
         font = widget.font()
@@ -147,23 +314,20 @@ class PerformanceInterface(QWidget):
         table_header.addWidget(BodyLabel("统计范围:"))
         self.range_combo = ComboBox()
         self.range_combo.addItems(["最近100条", "最近500条", "全部"])
-        self.range_combo.currentTextChanged.connect(self._refresh_data)
+        self.range_combo.currentTextChanged.connect(lambda _: self._range_timer.start())
         table_header.addWidget(self.range_combo)
         
         table_layout.addLayout(table_header)
         
         # 表格
-        self.metrics_table = TableWidget()
-        self.metrics_table.setColumnCount(8)
-        self.metrics_table.setHorizontalHeaderLabels([
-            "指标名称", "请求数", "成功率", "平均耗时", 
-            "最小耗时", "最大耗时", "P50", "P95"
-        ])
+        self.metrics_model = _MetricsTableModel(self)
+        self.metrics_table = TableView()
+        self.metrics_table.setModel(self.metrics_model)
         self.metrics_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.metrics_table.setEditTriggers(TableWidget.NoEditTriggers)
-        self.metrics_table.setSelectionBehavior(TableWidget.SelectRows)
+        self.metrics_table.setEditTriggers(TableView.NoEditTriggers)
+        self.metrics_table.setSelectionBehavior(TableView.SelectRows)
         self.metrics_table.setStyleSheet("""
-            TableWidget {
+            TableView {
                 border: 1px solid rgba(0,0,0,0.1);
                 border-radius: 4px;
             }
@@ -194,17 +358,78 @@ class PerformanceInterface(QWidget):
             return 500
         return None  # 全部
     
+    def showEvent(self, event):
+        super().showEvent(event)
+        # 自动刷新开启时恢复定时器，并立即补一次刷新
+        if self.auto_refresh and not self.refresh_timer.isActive():
+            self.refresh_timer.start(5000)
+            self._refresh_pending = True
+        if not self._loaded or self._refresh_pending:
+            self._loaded = True
+            self._refresh_data()
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # 界面隐藏时暂停自动刷新定时器
+        if self.auto_refresh:
+            self.refresh_timer.stop()
+    
     def _refresh_data(self):
         """刷新数据"""
+        # 界面隐藏或窗口最小化时不刷新，只记录待刷新
+        if not self.isVisible() or self.window().isMinimized():
+            self._refresh_pending = True
+            return
+        self._refresh_pending = False
+        
+        if self._stats_running:
+            self._refresh_queued = True
+            return
+        
         last_n = self._get_stats_range()
-        summary = self.monitor.get_summary()
-        stats = self.monitor.get_all_stats(last_n)
+        stats_key = (self.monitor.get_version(), last_n)
+        if stats_key == self._last_stats_key:
+            # 没有新数据，只更新运行时长和刷新时间
+            self._update_uptime(self.monitor.get_uptime())
+            self._update_timestamp()
+            return
+        self._last_stats_key = stats_key
+        
+        version = stats_key[0]
+        include_summary = self._summary_cache is None or self._summary_cache[0] != version
+        
+        worker = _StatsWorker(self.monitor, last_n, include_summary)
+        worker.finished.connect(self._on_snapshot_ready)
+        self._stats_worker = worker
+        self._stats_running = True
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_snapshot_ready(self, snapshot):
+        """统计完成后更新界面（snapshot 为 None 表示统计失败）"""
+        self._stats_running = False
+        try:
+            if snapshot is None:
+                # 清除数据版本，下次刷新重新统计
+                self._last_stats_key = None
+                self.status_label.setText("加载性能数据失败")
+            else:
+                self._apply_snapshot(snapshot)
+        finally:
+            if self._refresh_queued:
+                self._refresh_queued = False
+                self._refresh_data()
+    
+    def _apply_snapshot(self, snapshot: dict):
+        summary = snapshot["summary"]
+        if summary is None:
+            # 数据版本未变，复用缓存的摘要，只取最新运行时长
+            summary = {**self._summary_cache[1], **self.monitor.get_uptime()}
+        else:
+            self._summary_cache = (self._last_stats_key[0], summary)
+        stats = snapshot["stats"]
         
         # 更新概览卡片
-        self.uptime_card.set_value(
-            summary["uptime_formatted"],
-            f"共 {summary['uptime_seconds']:.0f} 秒"
-        )
+        self._update_uptime(summary)
         
         self.requests_card.set_value(
             str(summary["total_requests"]),
@@ -213,21 +438,14 @@ class PerformanceInterface(QWidget):
         
         success_rate = summary["overall_success_rate"]
         self.success_card.set_value(
-            f"{success_rate:.1%}",
+            "%.1f%%" % (success_rate * 100),
             "成功" if success_rate >= 0.95 else "需关注" if success_rate >= 0.8 else "异常"
         )
         
-        # 计算平均响应时间
-        total_duration = 0
-        total_count = 0
-        for s in stats.values():
-            if s["count"] > 0:
-                total_duration += s["avg_duration"] * s["count"]
-                total_count += s["count"]
-        
-        avg_time = total_duration / total_count if total_count > 0 else 0
+        # 平均响应时间（按请求数加权）
+        avg_time = snapshot["avg_duration"]
         self.avg_time_card.set_value(
-            f"{avg_time*1000:.0f}ms",
+            "%.0fms" % (avg_time * 1000),
             "快速" if avg_time < 0.5 else "正常" if avg_time < 2 else "较慢"
         )
         
@@ -235,45 +453,33 @@ class PerformanceInterface(QWidget):
         self._update_table(stats)
         
         # 更新状态
-        from datetime import datetime
-        self.last_update_label.setText(f"最后更新: {datetime.now().strftime('%H:%M:%S')}")
+        self._update_timestamp()
         self.status_label.setText(f"已加载 {len(stats)} 个指标")
     
+    def _update_uptime(self, uptime: dict):
+        """更新运行时长卡片"""
+        self.uptime_card.set_value(
+            uptime["uptime_formatted"],
+            f"共 {uptime['uptime_seconds']:.0f} 秒"
+        )
+    
+    def _update_timestamp(self):
+        """更新最后刷新时间"""
+        self.last_update_label.setText(f"最后更新: {time.strftime('%H:%M:%S')}")
+    
     def _update_table(self, stats: dict):
         """更新表格数据"""
-        # 指标名称映射
-        name_map = {
-            "chat_api": "💬 Chat API",
-            "embedding_api": "🔢 Embedding API",
-            "vector_search": "🔍 向量检索",
-            "keyword_search": "📝 关键词搜索",
-            "knowledge_add": "➕ 知识库添加",
-            "knowledge_update": "✏️ 知识库更新",
-        }
-        
-        # 过滤有数据的指标
-        active_stats = {k: v for k, v in stats.items() if v["count"] > 0}
-        
-        self.metrics_table.setRowCount(len(active_stats))
-        
-        for row, (name, s) in enumerate(active_stats.items()):
-            display_name = name_map.get(name, name)
-            
-            self.metrics_table.setItem(row, 0, self._create_item(display_name))
-            self.metrics_table.setItem(row, 1, self._create_item(str(s["count"])))
-            self.metrics_table.setItem(row, 2, self._create_item(f"{s['success_rate']:.1%}"))
-            self.metrics_table.setItem(row, 3, self._create_item(f"{s['avg_duration']*1000:.1f}ms"))
-            self.metrics_table.setItem(row, 4, self._create_item(f"{s['min_duration']*1000:.1f}ms"))
-            self.metrics_table.setItem(row, 5, self._create_item(f"{s['max_duration']*1000:.1f}ms"))
-            self.metrics_table.setItem(row, 6, self._create_item(f"{s['p50_duration']*1000:.1f}ms"))
-            self.metrics_table.setItem(row, 7, self._create_item(f"{s['p95_duration']*1000:.1f}ms"))
-    
-    def _create_item(self, text: str):
-        """创建表格项"""
-        from PySide6.QtWidgets import QTableWidgetItem
-        item = QTableWidgetItem(text)
-        item.setTextAlignment(Qt.AlignCenter)
-        return item
+        # 只显示有数据的指标，过滤与格式化在同一遍中完成
+        rows = [
+            (
+                _NAME_MAP_GET(name, name),
+                str(s["count"]),
+                "%.1f%%" % (s["success_rate"] * 100),
+                *[_format_ms(s[key] * 1000) for key in _DURATION_KEYS],
+            )
+            for name, s in stats.items() if s["count"] > 0
+        ]
+        self.metrics_model.set_rows(rows)
     
     def _toggle_auto_refresh(self, checked: bool):
         """切换自动刷新"""
@@ -295,29 +501,23 @@ class PerformanceInterface(QWidget):
         if not save_path:
             return
         
-        try:
-            report = self.monitor.export_report()
-            with open(save_path, 'w', encoding='utf-8') as f:
-                f.write(report)
-            
-            InfoBar.success(
-                title="导出成功",
-                content=f"报告已保存到: {save_path}",
-                parent=self,
-                position=InfoBarPosition.TOP
-            )
-        except Exception as e:
-            InfoBar.error(
-                title="导出失败",
-                content=str(e),
-                parent=self,
-                position=InfoBarPosition.TOP
-            )
+        worker = _ExportWorker(save_path, self.monitor.iter_report_chunks)
+        worker.finished.connect(self._on_export_finished)
+        self._export_worker = worker
+        self.export_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_export_finished(self, success: bool, message: str):
+        """导出完成"""
+        self.export_btn.setEnabled(True)
+        
+        if success:
+            self._show_info_bar(InfoBar.success, "导出成功", f"报告已保存到: {message}")
+        else:
+            self._show_info_bar(InfoBar.error, "导出失败", message)
     
     def _clear_data(self):
         """清空数据"""
-        from qfluentwidgets import MessageBox
-        
         box = MessageBox(
             "清空性能数据",
             "确定要清空所有性能监控数据吗？\n此操作不可恢复。",
@@ -328,12 +528,27 @@ class PerformanceInterface(QWidget):
             self.monitor.clear_all()
             self._refresh_data()
             
-            InfoBar.success(
-                title="已清空",
-                content="性能监控数据已清空",
-                parent=self,
-                position=InfoBarPosition.TOP
-            )
+            self._show_info_bar(InfoBar.success, "已清空", "性能监控数据已清空")
+    
+    def _show_info_bar(self, factory, title: str, content: str):
+        """显示提示条
+        
+        短时间内连续提示时先关闭上一条，避免多条提示条堆叠播放动画。
+        """
+        now = time.monotonic()
+        if self._info_bar is not None and now - self._last_info_bar_ts < _INFO_BAR_INTERVAL:
+            try:
+                self._info_bar.close()
+            except RuntimeError:
+                # 上一条已自动关闭并被销毁
+                pass
+        self._last_info_bar_ts = now
+        self._info_bar = factory(
+            title=title,
+            content=content,
+            parent=self,
+            position=InfoBarPosition.TOP
+        )
     
     def refresh(self):
         """外部调用刷新"""
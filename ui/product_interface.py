@@ -3,17 +3,23 @@
 商品管理界面 - 管理商品信息并自动同步到知识库
 """
 
+from functools import partial
+from types import MappingProxyType
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFrame,
-    QScrollArea, QTableWidgetItem, QHeaderView, 
-    QAbstractItemView, QDialog, QFormLayout, QApplication
+    QScrollArea, QHeaderView, 
+    QAbstractItemView, QDialog, QFormLayout, QApplication, QListWidgetItem
+)
+from PySide6.QtCore import (
+    Qt, Signal, QSize, QTimer, QAbstractTableModel, QModelIndex,
+    QObject, QRunnable, QThreadPool
 )
-from PySide6.QtCore import Qt, Signal, QSize
 
 from qfluentwidgets import (
     CardWidget, BodyLabel, TitleLabel, SubtitleLabel,
     PushButton, PrimaryPushButton, TransparentPushButton, TransparentToolButton,
-    ComboBox, TableWidget, SearchLineEdit, SpinBox, 
+    ComboBox, TableView, SearchLineEdit, SpinBox, 
     LineEdit, TextEdit, FluentIcon, ListWidget,
     MessageBox, InfoBar, InfoBarPosition, DoubleSpinBox
 )
@@ -21,6 +27,160 @@ from qfluentwidgets import (
 from core.shared_data import ProductStore, ProductItem
 from core.validators import ProductValidator
 from core.search import AdvancedSearch, SearchMode
+from core.statistics import StatisticsManager
+from ui.widgets import DeleteButtonDelegate
+
+
+# 商品分类选项及其下标
+_CATEGORY_CHOICES = (
+    "手机", "折叠屏手机", "平板电脑", "笔记本电脑", "耳机",
+    "智能音箱", "电视", "无人机", "运动相机", "游戏机", "其他"
+)
+_CATEGORY_INDEX = {cat: i for i, cat in enumerate(_CATEGORY_CHOICES)}
+
+# 分类图标
+_CAT_ICONS = MappingProxyType({
+    "手机": "📱", "折叠屏手机": "📲", "平板电脑": "💻", "笔记本电脑": "💻",
+    "耳机": "🎧", "智能音箱": "🔊", "电视": "📺", "无人机": "✈️",
+    "运动相机": "📷", "游戏机": "🎮", "其他": "📦"
+})
+
+# 搜索模式
+_SEARCH_MODE_MAP = MappingProxyType({
+    "包含": SearchMode.CONTAINS,
+    "精确": SearchMode.EXACT,
+    "模糊": SearchMode.FUZZY,
+    "前缀": SearchMode.PREFIX
+})
+
+# 样式表常量（模块加载时构建一次，各面板实例共享）
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #FAFAFA;
+    }
+    QLabel {
+        color: #333333;
+    }
+"""
+
+_CATEGORY_PANEL_QSS = """
+    QFrame { 
+        border-right: 1px solid rgba(0,0,0,0.1);
+        background-color: #FAFAFA;
+    }
+"""
+
+_CATEGORY_LIST_QSS = """
+    ListWidget {
+        border: none;
+        background-color: transparent;
+        outline: none;
+    }
+    ListWidget::item {
+        padding: 8px 16px;
+        border-radius: 8px;
+        margin: 1px 0;
+        border: none;
+        outline: none;
+    }
+    ListWidget::item:hover {
+        background-color: rgba(0, 120, 212, 0.1);
+        border: none;
+    }
+    ListWidget::item:selected {
+        background-color: rgba(0, 120, 212, 0.2);
+        color: #0078d4;
+        border: none;
+        outline: none;
+    }
+"""
+
+_DETAIL_PANEL_QSS = "QFrame { border-left: 1px solid rgba(0,0,0,0.1); }"
+
+_TOOLBAR_QSS = """
+    ProductToolbar { 
+        border: none;
+        border-top: 1px solid rgba(0,0,0,0.1);
+        background-color: #FAFAFA;
+    }
+"""
+
+# 分类列表项中保存商品数量的数据角色
+_COUNT_ROLE = Qt.UserRole + 1
+
+# 各面板共用的商品存储（首次使用时创建，避免导入模块时就加载商品数据）
+_PRODUCT_STORE = None
+
+
+def _get_product_store() -> ProductStore:
+    """获取共用的商品存储实例"""
+    global _PRODUCT_STORE
+    if _PRODUCT_STORE is None:
+        _PRODUCT_STORE = ProductStore()
+    return _PRODUCT_STORE
+
+
+class _SyncWorker(QObject, QRunnable):
+    """商品同步任务（在线程池中执行，避免同步知识库时阻塞界面）"""
+    
+    finished = Signal(int, int)
+    failed = Signal(str)
+    
+    def __init__(self, product_store: ProductStore):
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+        # 由工具栏持有引用，不交给线程池自动删除
+        self.setAutoDelete(False)
+        self._product_store = product_store
+    
+    def run(self):
+        try:
+            success, fail = self._product_store.sync_all_to_knowledge()
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(success, fail)
+
+
+class _ProductTableModel(QAbstractTableModel):
+    """商品列表表格模型
+    
+    直接引用商品对象，视图只对可见单元格调用 data()，显示文本来自 ProductItem 预先生成的字段。
+    """
+    
+    HEADERS = ["ID", "商品名称", "价格", "库存", "分类", "操作"]
+    
+    # 各列对应的商品属性（操作列由删除委托绘制，没有文本）
+    _COLUMN_ATTRS = ("id", "display_name", "display_price", "display_stock", "category", None)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._products: list = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._products)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        attr = self._COLUMN_ATTRS[index.column()]
+        if attr is None:
+            return None
+        return getattr(self._products[index.row()], attr)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def set_products(self, products: list):
+        """替换显示的商品列表"""
+        self.beginResetModel()
+        self._products = products
+        self.endResetModel()
 
 
 class AddProductDialog(QDialog):
@@ -46,14 +206,7 @@ class AddProductDialog(QDialog):
         self.setFixedSize(600, 650)
         self.setModal(True)
         self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #FAFAFA;
-            }
-            QLabel {
-                color: #333333;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -97,10 +250,7 @@ class AddProductDialog(QDialog):
         basic_layout.addRow("📊 库存数量：", self.stock_spin)
         
         self.category_combo = ComboBox()
-        self.category_combo.addItems([
-            "手机", "折叠屏手机", "平板电脑", "笔记本电脑", "耳机", 
-            "智能音箱", "电视", "无人机", "运动相机", "游戏机", "其他"
-        ])
+        self.category_combo.addItems(_CATEGORY_CHOICES)
         basic_layout.addRow("📁 商品分类：", self.category_combo)
         
         self.keywords_edit = LineEdit()
@@ -165,8 +315,8 @@ class AddProductDialog(QDialog):
         
         layout.addLayout(btn_layout)
         
-        # 初始化规格行列表
-        self.spec_rows = []
+        # 规格行：行控件 -> (规格名输入框, 规格值输入框)，按添加顺序保存
+        self.spec_rows: dict[QWidget, tuple[LineEdit, LineEdit]] = {}
         
         # 如果是编辑模式，填充数据
         if self.is_edit:
@@ -196,20 +346,23 @@ class AddProductDialog(QDialog):
         del_btn.setFixedSize(36, 32)
         del_btn.setIconSize(QSize(14, 14))
         self._ensure_valid_font_point_size(del_btn)
-        del_btn.clicked.connect(lambda: self._remove_spec_row(row_widget))
+        del_btn.clicked.connect(partial(self._remove_spec_row, row_widget))
         row_layout.addWidget(del_btn)
         
         self.spec_layout.addWidget(row_widget)
-        self.spec_rows.append((row_widget, key_edit, value_edit))
+        self.spec_rows[row_widget] = (key_edit, value_edit)
+        return key_edit, value_edit
     
-    def _remove_spec_row(self, row_widget):
+    def _remove_spec_row(self, row_widget, checked: bool = False):
         """删除规格行"""
-        for i, (widget, _, _) in enumerate(self.spec_rows):
-            if widget == row_widget:
-                self.spec_layout.removeWidget(row_widget)
-                row_widget.deleteLater()
-                del self.spec_rows[i]
-                break
+        if self.spec_rows.pop(row_widget, None) is None:
+            return
+        # 先屏蔽子控件信号并隐藏，避免已排队的事件在销毁前再触发槽函数
+        for child in row_widget.findChildren(QWidget):
+            child.blockSignals(True)
+        row_widget.hide()
+        self.spec_layout.removeWidget(row_widget)
+        row_widget.deleteLater()
     
     def _fill_data(self):
         """填充编辑数据"""
@@ -221,8 +374,8 @@ class AddProductDialog(QDialog):
         self.stock_spin.setValue(self.product.stock)
         
         # 设置分类
-        index = self.category_combo.findText(self.product.category)
-        if index >= 0:
+        index = _CATEGORY_INDEX.get(self.product.category)
+        if index is not None:
             self.category_combo.setCurrentIndex(index)
         else:
             self.category_combo.setCurrentText(self.product.category)
@@ -230,12 +383,16 @@ class AddProductDialog(QDialog):
         self.keywords_edit.setText(", ".join(self.product.keywords))
         self.desc_edit.setPlainText(self.product.description)
         
-        # 填充规格
-        for key, value in self.product.specifications.items():
-            self._add_spec_row()
-            _, key_edit, value_edit = self.spec_rows[-1]
-            key_edit.setText(key)
-            value_edit.setText(value)
+        # 填充规格（批量添加行，完成后统一布局一次）
+        self.spec_widget.setUpdatesEnabled(False)
+        try:
+            for key, value in self.product.specifications.items():
+                key_edit, value_edit = self._add_spec_row()
+                key_edit.setText(key)
+                value_edit.setText(value)
+        finally:
+            self.spec_widget.setUpdatesEnabled(True)
+        self.spec_layout.activate()
     
     def _validate_and_accept(self):
         """验证并保存"""
@@ -279,7 +436,7 @@ class AddProductDialog(QDialog):
         keywords = [k.strip() for k in self.keywords_edit.text().split(",") if k.strip()]
         
         specs = {}
-        for _, key_edit, value_edit in self.spec_rows:
+        for key_edit, value_edit in self.spec_rows.values():
             key = key_edit.text().strip()
             value = value_edit.text().strip()
             if key and value:
@@ -304,14 +461,10 @@ class ProductCategoryPanel(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedWidth(220)
-        self.setStyleSheet("""
-            QFrame { 
-                border-right: 1px solid rgba(0,0,0,0.1);
-                background-color: #FAFAFA;
-            }
-        """)
+        self.setStyleSheet(_CATEGORY_PANEL_QSS)
         
-        self.product_store = ProductStore()
+        self.product_store = _get_product_store()
+        self._refresh_pending = False
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 20, 16, 20)
@@ -323,73 +476,57 @@ class ProductCategoryPanel(QFrame):
         
         # 分类列表
         self.list_widget = ListWidget()
-        self.list_widget.setStyleSheet("""
-            ListWidget {
-                border: none;
-                background-color: transparent;
-                outline: none;
-            }
-            ListWidget::item {
-                padding: 8px 16px;
-                border-radius: 8px;
-                margin: 1px 0;
-                border: none;
-                outline: none;
-            }
-            ListWidget::item:hover {
-                background-color: rgba(0, 120, 212, 0.1);
-                border: none;
-            }
-            ListWidget::item:selected {
-                background-color: rgba(0, 120, 212, 0.2);
-                color: #0078d4;
-                border: none;
-                outline: none;
-            }
-        """)
+        self.list_widget.setStyleSheet(_CATEGORY_LIST_QSS)
         self.list_widget.itemClicked.connect(self._on_item_clicked)
         layout.addWidget(self.list_widget, 1)
         
         self._load_data()
     
     def _load_data(self):
-        self.list_widget.clear()
-        
-        # 全部
-        total = len(self.product_store.products)
-        self.list_widget.addItem(f"📋 全部商品 ({total})")
-        
-        # 分类统计
-        categories = {}
-        for product in self.product_store.products:
-            cat = product.category
-            categories[cat] = categories.get(cat, 0) + 1
-        
-        # 分类图标
-        cat_icons = {
-            "手机": "📱", "折叠屏手机": "📲", "平板电脑": "💻", "笔记本电脑": "💻",
-            "耳机": "🎧", "智能音箱": "🔊", "电视": "📺", "无人机": "✈️",
-            "运动相机": "📷", "游戏机": "🎮", "其他": "📦"
-        }
-        
-        for cat, count in sorted(categories.items()):
-            icon = cat_icons.get(cat, "📁")
-            self.list_widget.addItem(f"{icon} {cat} ({count})")
+        # 全部 + 各分类（分类数量由商品存储增量维护）
+        rows = [("全部", len(self.product_store.products))]
+        rows.extend(sorted(self.product_store.category_counts.items()))
+        
+        def row_text(cat, count):
+            if cat == "全部":
+                return f"📋 全部商品 ({count})"
+            return f"{_CAT_ICONS.get(cat, '📁')} {cat} ({count})"
+        
+        # 每项保存分类（UserRole）和数量（_COUNT_ROLE）。新旧列表顺序一致，
+        # 逐项比对：只移除消失的分类、插入新增的分类、更新数量变化的项，
+        # 保留其余列表项及当前选中项，不整体清空重建
+        lw = self.list_widget
+        new_cats = {cat for cat, _ in rows}
+        for i, (cat, count) in enumerate(rows):
+            while i < lw.count() and lw.item(i).data(Qt.UserRole) not in new_cats:
+                lw.takeItem(i)
+            item = lw.item(i) if i < lw.count() else None
+            if item is None or item.data(Qt.UserRole) != cat:
+                item = QListWidgetItem(row_text(cat, count))
+                item.setData(Qt.UserRole, cat)
+                item.setData(_COUNT_ROLE, count)
+                lw.insertItem(i, item)
+            elif item.data(_COUNT_ROLE) != count:
+                item.setText(row_text(cat, count))
+                item.setData(_COUNT_ROLE, count)
+        while lw.count() > len(rows):
+            lw.takeItem(len(rows))
     
     def refresh(self):
+        """请求刷新分类列表（同一轮事件循环内的多次请求合并为一次）"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._flush_refresh)
+    
+    def _flush_refresh(self):
+        self._refresh_pending = False
         self._load_data()
     
     def _on_item_clicked(self, item):
-        text = item.text()
-        if "全部商品" in text:
-            self.category_selected.emit("全部")
-        else:
-            parts = text.split(" ")
-            if len(parts) >= 2:
-                cat = " ".join(parts[1:-1])
-                if cat.endswith(")"):
-                    cat = cat.rsplit(" ", 1)[0]
-                self.category_selected.emit(cat)
+        # 分类名在加载时已保存在 UserRole 中（“全部”对应全部商品）
+        cat = item.data(Qt.UserRole)
+        if cat is not None:
+            self.category_selected.emit(cat)
 
 
 class ProductListPanel(QFrame):
@@ -402,8 +539,22 @@ class ProductListPanel(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        self.product_store = ProductStore()
+        self.product_store = _get_product_store()
         self.current_products = []
+        # 当前选中的分类，清空搜索框时恢复该分类的列表
+        self._active_category = "全部"
+        # 同步到知识库期间禁止增删商品
+        self._editable = True
+        
+        # 搜索防抖：连续输入时只执行最后一次搜索
+        self._pending_query = ""
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._do_search)
+        
+        # 是否已安排表格刷新
+        self._table_refresh_pending = False
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -435,9 +586,9 @@ class ProductListPanel(QFrame):
         layout.addLayout(top)
         
         # 表格
-        self.table = TableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["ID", "商品名称", "价格", "库存", "分类", "操作"])
+        self.table_model = _ProductTableModel(self)
+        self.table = TableView()
+        self.table.setModel(self.table_model)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.table.setColumnWidth(0, 60)
         self.table.setColumnWidth(2, 100)
@@ -446,65 +597,85 @@ class ProductListPanel(QFrame):
         self.table.setColumnWidth(5, 80)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.cellClicked.connect(self._on_row_clicked)
+        self.table.clicked.connect(self._on_index_clicked)
+        
+        # 操作列使用委托绘制删除图标
+        self._delete_delegate = DeleteButtonDelegate(self.table)
+        self._delete_delegate.delete_clicked.connect(self._on_delete_clicked)
+        self.table.setItemDelegateForColumn(5, self._delete_delegate)
         
         layout.addWidget(self.table, 1)
         
         self._load_all()
     
     def _load_all(self):
+        self._active_category = "全部"
         self.current_products = self.product_store.get_all_products()
         self._refresh_table()
     
     def load_by_category(self, category: str):
         # 不修改标题，避免UI重叠
+        self._active_category = category
         if category == "全部":
             self.current_products = self.product_store.get_all_products()
         else:
-            self.current_products = [p for p in self.product_store.products if p.category == category]
+            self.current_products = self.product_store.get_by_category(category)
         self._refresh_table()
     
     def _on_search(self, text: str):
+        self._pending_query = text
+        self._search_timer.start()
+    
+    def _do_search(self):
+        text = self._pending_query
         if not text:
-            self._load_all()
-        else:
-            # 获取搜索模式
-            mode_map = {
-                "包含": SearchMode.CONTAINS,
-                "精确": SearchMode.EXACT,
-                "模糊": SearchMode.FUZZY,
-                "前缀": SearchMode.PREFIX
-            }
-            mode = mode_map.get(self.search_mode.currentText(), SearchMode.CONTAINS)
-            
-            # 使用高级搜索
-            searcher = AdvancedSearch(
-                self.product_store.products,
-                search_fields=["name", "description", "keywords"]
-            )
-            results = searcher.search(text, mode=mode)
-            self.current_products = [r.item for r in results]
+            # 清空搜索时恢复之前选中的分类
+            self.load_by_category(self._active_category)
+            return
+        
+        # 获取搜索模式
+        mode = _SEARCH_MODE_MAP.get(self.search_mode.currentText(), SearchMode.CONTAINS)
+        
+        # 使用高级搜索
+        searcher = AdvancedSearch(
+            self.product_store.products,
+            search_fields=["name", "description", "keywords"]
+        )
+        results = searcher.search(text, mode=mode)
+        self.current_products = [r.item for r in results]
         self._refresh_table()
     
     def _refresh_table(self):
-        self.table.setRowCount(len(self.current_products))
-        
-        for i, product in enumerate(self.current_products):
-            self.table.setItem(i, 0, QTableWidgetItem(product.id))
-            name_text = product.name[:25] + "..." if len(product.name) > 25 else product.name
-            self.table.setItem(i, 1, QTableWidgetItem(name_text))
-            self.table.setItem(i, 2, QTableWidgetItem(f"¥{product.price:.2f}"))
-            stock_text = f"{product.stock}" if product.stock > 0 else "缺货"
-            self.table.setItem(i, 3, QTableWidgetItem(stock_text))
-            self.table.setItem(i, 4, QTableWidgetItem(product.category))
-            self.table.setItem(i, 5, QTableWidgetItem("🗑️ 删除"))
+        """请求刷新表格（同一轮事件循环内的多次请求合并为一次）"""
+        if not self._table_refresh_pending:
+            self._table_refresh_pending = True
+            QTimer.singleShot(0, self._flush_refresh)
+    
+    def _flush_refresh(self):
+        self._table_refresh_pending = False
+        self._do_refresh_table()
+    
+    def _do_refresh_table(self):
+        self.table_model.set_products(self.current_products)
+    
+    def _on_index_clicked(self, index):
+        self._on_row_clicked(index.row(), index.column())
     
     def _on_row_clicked(self, row: int, column: int):
+        # 操作列的点击由删除委托处理
+        if column == 5:
+            return
         if 0 <= row < len(self.current_products):
-            if column == 5:
-                self._delete_product(row)
-            else:
-                self.product_selected.emit(self.current_products[row])
+            self.product_selected.emit(self.current_products[row])
+    
+    def _on_delete_clicked(self, row: int):
+        if self._editable and 0 <= row < len(self.current_products):
+            self._delete_product(row)
+    
+    def set_editable(self, editable: bool):
+        """启用/禁用添加和删除商品"""
+        self._editable = editable
+        self.add_btn.setEnabled(editable)
     
     def _add_product(self):
         """添加商品"""
@@ -587,10 +758,13 @@ class ProductDetailPanel(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedWidth(350)
-        self.setStyleSheet("QFrame { border-left: 1px solid rgba(0,0,0,0.1); }")
+        self.setStyleSheet(_DETAIL_PANEL_QSS)
         
-        self.product_store = ProductStore()
+        self.product_store = _get_product_store()
         self.current_product = None
+        self._loaded_revision = None
+        # 同步到知识库期间禁止编辑商品
+        self._editable = True
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -681,30 +855,46 @@ class ProductDetailPanel(QFrame):
         self.content_layout.addStretch()
     
     def load_product(self, product: ProductItem):
+        # 重复点击同一商品且内容未修改时，标签文本不变，无需重新设置
+        if product is self.current_product and product.revision == self._loaded_revision:
+            return
         self.current_product = product
-        self.edit_btn.setEnabled(True)
+        self._loaded_revision = product.revision
+        self.edit_btn.setEnabled(self._editable)
         
         self.title.setText(f"📦 商品详情 - {product.id}")
-        self.id_label.setText(f"🆔 ID：{product.id}")
-        self.name_label.setText(f"📦 名称：{product.name}")
-        self.price_label.setText(f"💰 价格：¥{product.price:.2f}")
-        
-        stock_text = f"{product.stock}件" if product.stock > 0 else "缺货"
-        self.stock_label.setText(f"📊 库存：{stock_text}")
-        self.cat_label.setText(f"📁 分类：{product.category}")
-        self.keywords_label.setText(f"🏷️ 关键词：{', '.join(product.keywords)}")
-        
-        if product.specifications:
-            spec_lines = [f"  • {k}: {v}" for k, v in product.specifications.items()]
-            self.spec_label.setText("\n".join(spec_lines))
-        else:
-            self.spec_label.setText("暂无规格参数")
         
-        self.desc_label.setText(product.description)
+        # 批量更新滚动区域内的标签，全部设置完后只重新布局和绘制一次
+        self.content.setUpdatesEnabled(False)
+        try:
+            self.id_label.setText(f"🆔 ID：{product.id}")
+            self.name_label.setText(f"📦 名称：{product.name}")
+            self.price_label.setText(f"💰 价格：¥{product.price:.2f}")
+            
+            stock_text = f"{product.stock}件" if product.stock > 0 else "缺货"
+            self.stock_label.setText(f"📊 库存：{stock_text}")
+            self.cat_label.setText(f"📁 分类：{product.category}")
+            self.keywords_label.setText(f"🏷️ 关键词：{', '.join(product.keywords)}")
+            
+            if product.specifications:
+                spec_lines = [f"  • {k}: {v}" for k, v in product.specifications.items()]
+                self.spec_label.setText("\n".join(spec_lines))
+            else:
+                self.spec_label.setText("暂无规格参数")
+            
+            self.desc_label.setText(product.description)
+        finally:
+            self.content.setUpdatesEnabled(True)
+        self.content.updateGeometry()
+    
+    def set_editable(self, editable: bool):
+        """启用/禁用编辑商品"""
+        self._editable = editable
+        self.edit_btn.setEnabled(editable and self.current_product is not None)
     
     def _edit_product(self):
         """编辑商品"""
-        if not self.current_product:
+        if not self.current_product or not self._editable:
             return
         
         try:
@@ -767,26 +957,23 @@ class ProductToolbar(QFrame):
     """底部工具栏"""
     
     sync_completed = Signal()
+    sync_running_changed = Signal(bool)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(50)
-        self.setStyleSheet("""
-            ProductToolbar { 
-                border: none;
-                border-top: 1px solid rgba(0,0,0,0.1);
-                background-color: #FAFAFA;
-            }
-        """)
+        self.setStyleSheet(_TOOLBAR_QSS)
         
-        self.product_store = ProductStore()
+        self.product_store = _get_product_store()
+        self._sync_worker = None
+        self._stats_pending = False
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(20, 10, 20, 10)
         layout.setSpacing(16)
         
         # 商品统计
-        self.stats_label = BodyLabel(f"🛍️ 共 {len(ProductStore().products)} 个商品")
+        self.stats_label = BodyLabel(f"🛍️ 共 {len(self.product_store.products)} 个商品")
         self.stats_label.setStyleSheet("color: gray;")
         layout.addWidget(self.stats_label)
         
@@ -801,44 +988,58 @@ class ProductToolbar(QFrame):
         """同步所有商品到知识库"""
         self.sync_btn.setEnabled(False)
         self.sync_btn.setText("同步中...")
+        self.sync_running_changed.emit(True)
         
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(100, self._do_sync)
+        worker = _SyncWorker(self.product_store)
+        worker.finished.connect(self._on_sync_finished)
+        worker.failed.connect(self._on_sync_failed)
+        self._sync_worker = worker
+        QThreadPool.globalInstance().start(worker)
     
-    def _do_sync(self):
-        """执行同步"""
-        try:
-            success, fail = self.product_store.sync_all_to_knowledge()
-            if fail == 0:
-                InfoBar.success(
-                    title="同步成功",
-                    content=f"已将 {success} 个商品同步到知识库",
-                    parent=self,
-                    position=InfoBarPosition.TOP
-                )
-            else:
-                InfoBar.warning(
-                    title="部分同步成功",
-                    content=f"成功 {success} 个，失败 {fail} 个",
-                    parent=self,
-                    position=InfoBarPosition.TOP
-                )
-            self.sync_completed.emit()
-        except Exception as e:
-            print(f"同步商品出错: {e}")
-            InfoBar.error(
-                title="同步失败",
-                content=str(e),
+    def _on_sync_finished(self, success: int, fail: int):
+        """同步完成"""
+        self._end_sync()
+        if fail == 0:
+            InfoBar.success(
+                title="同步成功",
+                content=f"已将 {success} 个商品同步到知识库",
                 parent=self,
                 position=InfoBarPosition.TOP
             )
-        finally:
-            self.sync_btn.setEnabled(True)
-            self.sync_btn.setText("同步所有商品到知识库")
+        else:
+            InfoBar.warning(
+                title="部分同步成功",
+                content=f"成功 {success} 个，失败 {fail} 个",
+                parent=self,
+                position=InfoBarPosition.TOP
+            )
+        self.sync_completed.emit()
+    
+    def _on_sync_failed(self, error: str):
+        """同步出错"""
+        self._end_sync()
+        print(f"同步商品出错: {error}")
+        InfoBar.error(
+            title="同步失败",
+            content=error,
+            parent=self,
+            position=InfoBarPosition.TOP
+        )
+    
+    def _end_sync(self):
+        self.sync_btn.setEnabled(True)
+        self.sync_btn.setText("同步所有商品到知识库")
+        self.sync_running_changed.emit(False)
     
     def refresh_stats(self):
-        """刷新统计"""
-        self.stats_label.setText(f"🛍️ 共 {len(ProductStore().products)} 个商品")
+        """刷新统计（同一轮事件循环内的多次请求合并为一次）"""
+        if not self._stats_pending:
+            self._stats_pending = True
+            QTimer.singleShot(0, self._flush_stats)
+    
+    def _flush_stats(self):
+        self._stats_pending = False
+        self.stats_label.setText(f"🛍️ 共 {len(self.product_store.products)} 个商品")
 
 
 class ProductInterface(QWidget):
@@ -847,6 +1048,13 @@ class ProductInterface(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("product_interface")
+        
+        # 商品变更防抖：连续的增删改只触发一次分类、工具栏和列表刷新
+        self._change_timer = QTimer(self)
+        self._change_timer.setSingleShot(True)
+        self._change_timer.setInterval(150)
+        self._change_timer.timeout.connect(self._do_product_changed)
+        
         self._init_ui()
     
     def _init_ui(self):
@@ -876,6 +1084,7 @@ class ProductInterface(QWidget):
         layout.addWidget(content, 1)
         
         self.toolbar = ProductToolbar()
+        self.toolbar.sync_running_changed.connect(self._on_sync_running_changed)
         layout.addWidget(self.toolbar)
     
     def _on_category_selected(self, category: str):
@@ -884,8 +1093,17 @@ class ProductInterface(QWidget):
     def _on_product_selected(self, product: ProductItem):
         self.detail_panel.load_product(product)
     
+    def _on_sync_running_changed(self, running: bool):
+        # 后台同步遍历商品列表期间，不允许界面线程修改商品
+        self.product_list_panel.set_editable(not running)
+        self.detail_panel.set_editable(not running)
+    
     def _on_product_changed(self, *args):
-        """商品变更后刷新"""
+        """商品变更后刷新（统计缓存立即失效，界面刷新防抖合并为一次）"""
+        StatisticsManager().invalidate()
+        self._change_timer.start()
+    
+    def _do_product_changed(self):
         self.category_panel.refresh()
         self.toolbar.refresh_stats()
         self.product_list_panel._load_all()
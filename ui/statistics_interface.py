@@ -125,8 +125,14 @@ class StatisticsInterface(QWidget):
         
         self.stats_manager = StatisticsManager()
         
+        # 刷新防抖：连续点击或频繁的外部刷新请求合并为一次
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(150)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        
         self._init_ui()
-        self._refresh_data()
+        self._do_refresh()
     
     def _init_ui(self):
         # 使用滚动区域
@@ -256,6 +262,10 @@ class StatisticsInterface(QWidget):
         main_layout.addWidget(scroll)
     
     def _refresh_data(self):
+        """请求刷新数据（防抖，150ms内的多次请求只刷新一次）"""
+        self._refresh_timer.start()
+    
+    def _do_refresh(self):
         """刷新数据"""
         stats = self.stats_manager.get_usage_stats()
         
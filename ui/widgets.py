@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+通用界面组件
+供多个管理页面共用的表格委托等小部件
+"""
+
+from PySide6.QtWidgets import QStyledItemDelegate
+from PySide6.QtCore import Qt, Signal, QEvent, QRect
+
+from qfluentwidgets import FluentIcon
+
+
+class DeleteButtonDelegate(QStyledItemDelegate):
+    """删除列委托 - 直接绘制共享的删除图标，无需为每行创建单元格
+    
+    左键在同一单元格内按下并释放才视为一次点击，发出 delete_clicked(行号)。
+    """
+    
+    delete_clicked = Signal(int)
+    
+    ICON_SIZE = 16
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._icon = FluentIcon.DELETE.icon()
+        # 左键按下时所在的单元格 (行, 列)
+        self._pressed = None
+    
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        size = self.ICON_SIZE
+        rect = QRect(0, 0, size, size)
+        rect.moveCenter(option.rect.center())
+        self._icon.paint(painter, rect)
+    
+    def editorEvent(self, event, model, option, index):
+        et = event.type()
+        if et == QEvent.MouseButtonPress and event.button() == Qt.LeftButton:
+            self._pressed = (index.row(), index.column())
+            return True
+        if et == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            pressed, self._pressed = self._pressed, None
+            if pressed == (index.row(), index.column()):
+                self.delete_clicked.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)